@@ -9,32 +9,75 @@ import numpy as np
 from datetime import datetime
 import os
 
+NS_PER_DAY = 86_400_000_000_000
+
+# Days-since-last-permit buckets: <= 30, <= 90, <= 180, <= 365, older
+ACTIVITY_BUCKET_EDGES = np.array([30, 90, 180, 365], dtype=np.int32)
+ACTIVITY_LEVELS = ['Very Active (< 30 days)', 'Active (30-90 days)',
+                   'Moderate (90-180 days)', 'Low (180-365 days)', 'Inactive (> 1 year)']
+
+# Only these permit columns feed the call sheet
+PERMIT_COLUMNS = [
+    'permitNumber', 'permitType', 'workType', 'issueDate', 'totalFees',
+    'applicantName', 'applicantAddress1', 'applicantCity', 'fullName',
+    'Neighborhoods_Desc'
+]
+
+def add_activity_metrics(plumber_summary):
+    """Add recency, activity level and permits-per-year columns in one pass"""
+    first_dates = plumber_summary['First_Permit_Date'].to_numpy(dtype='datetime64[ns]')
+    last_dates = plumber_summary['Last_Permit_Date'].to_numpy(dtype='datetime64[ns]')
+    total_permits = plumber_summary['Total_Permits'].to_numpy()
+    
+    # Calculate whole days since last permit (NaN when a plumber has no dated permit)
+    today_ns = pd.Timestamp.now().value
+    days_since = ((today_ns - last_dates.view('i8')) // NS_PER_DAY).astype('int32')
+    plumber_summary['Days_Since_Last_Permit'] = pd.Series(
+        days_since, index=plumber_summary.index
+    ).where(~np.isnat(last_dates))
+    
+    # Add activity classification (upper bucket edges are inclusive)
+    activity_codes = np.searchsorted(ACTIVITY_BUCKET_EDGES, days_since, side='left')
+    plumber_summary['Activity_Level'] = pd.Categorical.from_codes(
+        np.where(np.isnat(last_dates), -1, activity_codes),
+        categories=ACTIVITY_LEVELS,
+        ordered=True
+    )
+    
+    # Calculate average permits per year from whole days between first and last permit
+    has_dates = ~(np.isnat(first_dates) | np.isnat(last_dates))
+    active_days = (last_dates.view('i8') - first_dates.view('i8')) // NS_PER_DAY
+    years_active = np.round(np.where(has_dates, active_days / 365.25, np.nan), 1)
+    plumber_summary['Years_Active'] = years_active
+    plumber_summary['Avg_Permits_Per_Year'] = np.round(
+        total_permits / np.where(years_active == 0, 1, years_active), 1
+    )
+
 def extract_plumber_contacts():
     """Extract and process plumber contact information from permit data"""
     
     print("Loading permit data...")
-    df = pd.read_csv('source/CCS_Permits.csv')
+    df = pd.read_csv('source/CCS_Permits.csv', usecols=PERMIT_COLUMNS)
     
-    # Filter for plumbing permits only
-    plumbing_df = df[df['permitType'] == 'Plumbing'].copy()
+    # Filter for plumbing permits only; group keys repeat heavily, so store them as categoricals
+    plumbing_df = df.loc[df['permitType'] == 'Plumbing'].astype(
+        {col: 'category' for col in ['applicantName', 'Neighborhoods_Desc', 'workType']}
+    )
     print(f"Found {len(plumbing_df)} plumbing permits")
     
     # Convert dates and ensure they are timezone-naive
-    plumbing_df['issueDate'] = pd.to_datetime(plumbing_df['issueDate'], errors='coerce', utc=True).dt.tz_localize(None)
-    plumbing_df['completeDate'] = pd.to_datetime(plumbing_df['completeDate'], errors='coerce', utc=True).dt.tz_localize(None)
+    plumbing_df = plumbing_df.assign(
+        issueDate=pd.to_datetime(plumbing_df['issueDate'], errors='coerce', utc=True).dt.tz_localize(None)
+    )
     
     # Group by applicant to get unique plumbers with aggregated data
-    plumber_summary = plumbing_df.groupby('applicantName').agg({
+    plumber_summary = plumbing_df.groupby('applicantName', observed=True).agg({
         'permitNumber': 'count',
         'applicantAddress1': 'first',
         'applicantCity': 'first',
         'fullName': 'first',
-        'Neighborhoods_Desc': lambda x: ', '.join(sorted(set(x.dropna()))),
         'issueDate': ['min', 'max'],
-        'value': 'sum',
-        'totalFees': 'sum',
-        'status': lambda x: x.value_counts().to_dict(),
-        'workType': lambda x: x.value_counts().head(3).to_dict()
+        'totalFees': 'sum'
     }).reset_index()
     
     # Flatten column names
@@ -44,40 +87,45 @@ def extract_plumber_contacts():
         'Address',
         'City',
         'Contact_Person',
-        'Service_Areas',
         'First_Permit_Date',
         'Last_Permit_Date',
-        'Total_Project_Value',
-        'Total_Fees_Paid',
-        'Status_Distribution',
-        'Top_Work_Types'
+        'Total_Fees_Paid'
     ]
     
-    # Calculate days since last permit
-    today = pd.Timestamp.now()
-    plumber_summary['Days_Since_Last_Permit'] = (today - plumber_summary['Last_Permit_Date']).dt.days
-    
-    # Add activity classification
-    plumber_summary['Activity_Level'] = pd.cut(
-        plumber_summary['Days_Since_Last_Permit'],
-        bins=[0, 30, 90, 180, 365, float('inf')],
-        labels=['Very Active (< 30 days)', 'Active (30-90 days)', 
-                'Moderate (90-180 days)', 'Low (180-365 days)', 'Inactive (> 1 year)']
+    # Distinct neighborhoods per plumber, alphabetical
+    service_areas = (
+        plumbing_df[['applicantName', 'Neighborhoods_Desc']]
+        .dropna()
+        .drop_duplicates()
+        .astype({'Neighborhoods_Desc': str})
+        .sort_values(['applicantName', 'Neighborhoods_Desc'])
+        .groupby('applicantName', observed=True)['Neighborhoods_Desc']
+        .agg(', '.join)
+    )
+    plumber_summary['Service_Areas'] = (
+        service_areas.reindex(plumber_summary['Company_Name']).fillna('').to_numpy()
     )
     
-    # Calculate average permits per year
-    plumber_summary['Years_Active'] = (
-        (plumber_summary['Last_Permit_Date'] - plumber_summary['First_Permit_Date']).dt.days / 365.25
-    ).round(1)
-    plumber_summary['Avg_Permits_Per_Year'] = (
-        plumber_summary['Total_Permits'] / plumber_summary['Years_Active'].replace(0, 1)
-    ).round(1)
-    
-    # Clean up work types for readability
-    plumber_summary['Top_Work_Types'] = plumber_summary['Top_Work_Types'].apply(
-        lambda x: ', '.join([f"{k}: {v}" for k, v in x.items()]) if isinstance(x, dict) else ''
+    # Top three work types per plumber as "type: count", ties in order of first appearance (as value_counts)
+    work_type_counts = (
+        plumbing_df.assign(first_seen=np.arange(len(plumbing_df)))
+        .groupby(['applicantName', 'workType'], observed=True)['first_seen']
+        .agg(count='size', first_seen='min')
+        .sort_values(['count', 'first_seen'], ascending=[False, True])
+        .groupby(level='applicantName', observed=True)
+        .head(3)
+        .reset_index()
+    )
+    work_type_counts['label'] = (
+        work_type_counts['workType'].astype(str) + ': ' + work_type_counts['count'].astype(str)
+    )
+    top_work_types = work_type_counts.groupby('applicantName', observed=True)['label'].agg(', '.join)
+    plumber_summary['Top_Work_Types'] = (
+        top_work_types.reindex(plumber_summary['Company_Name']).fillna('').to_numpy()
     )
     
+    add_activity_metrics(plumber_summary)
+    
     # Sort by total permits (highest volume first)
     plumber_summary = plumber_summary.sort_values('Total_Permits', ascending=False)
     
@@ -98,14 +146,12 @@ def extract_plumber_contacts():
         'Last_Permit_Date'
     ]
     
-    call_sheet = plumber_summary[call_sheet_columns].copy()
-    
-    # Format dates for readability
-    call_sheet['First_Permit_Date'] = call_sheet['First_Permit_Date'].dt.strftime('%Y-%m-%d')
-    call_sheet['Last_Permit_Date'] = call_sheet['Last_Permit_Date'].dt.strftime('%Y-%m-%d')
-    
-    # Round numeric columns
-    call_sheet['Total_Fees_Paid'] = call_sheet['Total_Fees_Paid'].round(2)
+    # Format dates for readability and round numeric columns
+    call_sheet = plumber_summary[call_sheet_columns].assign(
+        First_Permit_Date=plumber_summary['First_Permit_Date'].dt.strftime('%Y-%m-%d'),
+        Last_Permit_Date=plumber_summary['Last_Permit_Date'].dt.strftime('%Y-%m-%d'),
+        Total_Fees_Paid=plumber_summary['Total_Fees_Paid'].round(2)
+    )
     
     # Save to CSV with 'Claude' appended
     output_filename = 'plumber_contacts_Claude.csv'
@@ -121,7 +167,7 @@ def extract_plumber_contacts():
     print(call_sheet[['Company_Name', 'Total_Permits', 'Activity_Level']].head(10).to_string(index=False))
     
     # Also create a filtered version with only active plumbers
-    active_plumbers = call_sheet[call_sheet['Days_Since_Last_Permit'] <= 180].copy()
+    active_plumbers = call_sheet[call_sheet['Days_Since_Last_Permit'] <= 180]
     active_filename = 'plumber_contacts_active_only_Claude.csv'
     active_plumbers.to_csv(active_filename, index=False)
     print(f"\nAlso saved active plumbers only (last 180 days) to: {active_filename}")
@@ -5,6 +5,14 @@ Generate an interactive contractor contact dashboard with verified contact infor
 
 import pandas as pd
 import json
+import re
+from pipeline_cache import outputs_up_to_date
+
+# Columns of the merged contractor data used by the dashboard
+DASHBOARD_COLUMNS = [
+    'applicant_name', 'applicant_type', 'total_permits', 'Contact_Person', 'Phone_Number',
+    'Email', 'Activity_Level', 'Days_Since_Last_Permit', 'Contact_Info_Source', 'Contact_Confidence'
+]
 
 def generate_dashboard():
     """Generate the contractor contact dashboard with real data"""
@@ -12,7 +20,8 @@ def generate_dashboard():
     print("Loading contractor data...")
     
     # Load the merged contractor data
-    df = pd.read_csv('reports/drill_down_reports/data/plumbing_contractors_with_contacts.csv')
+    df = pd.read_csv('reports/drill_down_reports/data/plumbing_contractors_with_contacts.csv',
+                     usecols=DASHBOARD_COLUMNS, dtype={'applicant_type': 'category'})
     
     # Filter to contractors only
     contractors_df = df[df['applicant_type'] == 'Contractor'].copy()
@@ -28,48 +37,47 @@ def generate_dashboard():
     contractors_df['Contact_Confidence'] = contractors_df['Contact_Confidence'].fillna('None')
     contractors_df['Activity_Level'] = contractors_df['Activity_Level'].fillna('Unknown')
     
+    # Label columns hold a handful of values, so store them as categoricals
+    for col in ['Contact_Info_Source', 'Contact_Confidence', 'Activity_Level']:
+        contractors_df[col] = contractors_df[col].astype('category')
+    
     # Prepare data for JavaScript
-    contractor_list = []
-    for _, row in contractors_df.iterrows():
-        phone = str(row['Phone_Number']) if row['Phone_Number'] and row['Phone_Number'] != 'nan' else ''
-        email = str(row['Email']) if row['Email'] and row['Email'] != 'nan' else ''
-        contact = str(row['Contact_Person']) if row['Contact_Person'] and row['Contact_Person'] != 'nan' else ''
-        
-        contractor_list.append({
-            'company': str(row['applicant_name']),
-            'contact': contact,
-            'phone': phone,
-            'email': email,
-            'permits': int(row['total_permits']),
-            'activity': str(row['Activity_Level']),
-            'daysSince': int(row['Days_Since_Last_Permit']) if pd.notna(row['Days_Since_Last_Permit']) else 0,
-            'source': str(row['Contact_Info_Source']),
-            'confidence': str(row['Contact_Confidence'])
-        })
-    
-    # Calculate statistics (count non-empty strings)
+    contractor_json = pd.DataFrame({
+        'company': contractors_df['applicant_name'].astype(str),
+        'contact': contractors_df['Contact_Person'].astype(str).replace('nan', ''),
+        'phone': contractors_df['Phone_Number'].astype(str).replace('nan', ''),
+        'email': contractors_df['Email'].astype(str).replace('nan', ''),
+        'permits': contractors_df['total_permits'].astype(int),
+        'activity': contractors_df['Activity_Level'].astype(str),
+        'daysSince': contractors_df['Days_Since_Last_Permit'].fillna(0).astype(int),
+        'source': contractors_df['Contact_Info_Source'].astype(str),
+        'confidence': contractors_df['Contact_Confidence'].astype(str)
+    })
+    contractor_list = contractor_json.to_dict(orient='records')
+    
+    # Calculate statistics (count non-empty strings, NaNs were filled above)
+    has_phone = contractors_df['Phone_Number'] != ''
+    has_email = contractors_df['Email'] != ''
     total_contractors = len(contractors_df)
-    with_phone = ((contractors_df['Phone_Number'] != '') & (contractors_df['Phone_Number'].notna())).sum()
-    with_email = ((contractors_df['Email'] != '') & (contractors_df['Email'].notna())).sum()
-    with_both = ((contractors_df['Phone_Number'] != '') & (contractors_df['Phone_Number'].notna()) & 
-                 (contractors_df['Email'] != '') & (contractors_df['Email'].notna())).sum()
+    with_phone = has_phone.sum()
+    with_email = has_email.sum()
+    with_both = (has_phone & has_email).sum()
     
     # Read the template
     with open('reports/drill_down_reports/contractor_contact_dashboard.html', 'r') as f:
         html_content = f.read()
     
-    # Update statistics in the HTML
-    html_content = html_content.replace('>831</div>', f'>{total_contractors}</div>')
-    html_content = html_content.replace('>251</div>', f'>{with_phone}</div>')
-    html_content = html_content.replace('>377</div>', f'>{with_email}</div>')
-    html_content = html_content.replace('>247</div>', f'>{with_both}</div>')
-    
-    # Replace the sample data with real data
-    js_data = json.dumps(contractor_list, indent=2)
-    html_content = html_content.replace(
-        'const contractors = [',
-        f'const contractors = {js_data};\n\n// Original sample data replaced with real data\nconst contractors_original = ['
-    )
+    # Update statistics and replace the sample data with real data in one pass over the template
+    js_data = json.dumps(contractor_list, separators=(',', ':'))
+    replacements = {
+        '>831</div>': f'>{total_contractors}</div>',
+        '>251</div>': f'>{with_phone}</div>',
+        '>377</div>': f'>{with_email}</div>',
+        '>247</div>': f'>{with_both}</div>',
+        'const contractors = [': f'const contractors = {js_data};\n\n// Original sample data replaced with real data\nconst contractors_original = ['
+    }
+    template_markers = re.compile('|'.join(map(re.escape, replacements)))
+    html_content = template_markers.sub(lambda match: replacements[match.group(0)], html_content)
     
     # Save the updated dashboard
     output_file = 'reports/drill_down_reports/contractor_contact_dashboard_live.html'
@@ -84,16 +92,15 @@ def generate_dashboard():
     print(f"- With both: {with_both} ({with_both/total_contractors*100:.1f}%)")
     
     # Also update the main plumbing report
-    update_plumbing_report(contractors_df)
+    update_plumbing_report(contractors_df, has_phone, has_email)
 
-def update_plumbing_report(contractors_df):
+def update_plumbing_report(contractors_df, has_phone, has_email):
     """Add contact information section to the plumbing detailed report"""
     
-    # Calculate stats properly
-    with_phone = ((contractors_df['Phone_Number'] != '') & (contractors_df['Phone_Number'].notna())).sum()
-    with_email = ((contractors_df['Email'] != '') & (contractors_df['Email'].notna())).sum()
-    with_both = ((contractors_df['Phone_Number'] != '') & (contractors_df['Phone_Number'].notna()) & 
-                 (contractors_df['Email'] != '') & (contractors_df['Email'].notna())).sum()
+    # Calculate stats from the masks already computed for the dashboard
+    with_phone = has_phone.sum()
+    with_email = has_email.sum()
+    with_both = (has_phone & has_email).sum()
     
     # Create a summary section for the plumbing report
     contact_summary = f"""
@@ -141,16 +148,15 @@ def update_plumbing_report(contractors_df):
     # Add top 20 contractors with verified contacts
     verified = contractors_df[contractors_df['Contact_Info_Source'] == 'Licensed Data'].head(20)
     
-    for _, row in verified.iterrows():
-        contact_summary += f"""
+    contact_summary += "".join(f"""
                     <tr class="contractor">
-                        <td>{row['applicant_name']}</td>
-                        <td>{row['Phone_Number']}</td>
-                        <td>{row['Email']}</td>
-                        <td>{row['total_permits']:,}</td>
-                        <td>{row['Contact_Info_Source']}</td>
+                        <td>{row.applicant_name}</td>
+                        <td>{row.Phone_Number}</td>
+                        <td>{row.Email}</td>
+                        <td>{row.total_permits:,}</td>
+                        <td>{row.Contact_Info_Source}</td>
                     </tr>
-        """
+        """ for row in verified.itertuples(index=False))
     
     contact_summary += """
                 </tbody>
@@ -165,4 +171,14 @@ def update_plumbing_report(contractors_df):
     print("\nCreated contact summary section for plumbing report")
 
 if __name__ == "__main__":
-    generate_dashboard()
\ No newline at end of file
+    # Only the contact section is written by this script alone; the live dashboard is also
+    # rewritten by remove_license_contact_column.py and update_dashboard_links.py, so its
+    # mtime says nothing about whether this step is current
+    if outputs_up_to_date(
+        ['reports/drill_down_reports/plumbing_contact_section.html'],
+        ['reports/drill_down_reports/data/plumbing_contractors_with_contacts.csv',
+         'reports/drill_down_reports/contractor_contact_dashboard.html', __file__]
+    ):
+        print("Contractor dashboard is up to date (pass --force to rebuild)")
+    else:
+        generate_dashboard()
\ No newline at end of file
@@ -6,9 +6,16 @@ Match plumber permit data with license data to add real contact information
 import pandas as pd
 import pypdf
 import re
-from difflib import SequenceMatcher
 from collections import defaultdict
 import numpy as np
+from rapidfuzz import fuzz, process
+from pipeline_cache import cached_by_file_hash, outputs_up_to_date
+
+# Patterns used to pull contact details out of license lines
+PHONE_RE = re.compile(r'(\d{3}-\d{3}-\d{4})')
+EMAIL_RE = re.compile(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+ADDRESS_RE = re.compile(r'\d+\s+[A-Z]')
+WHITESPACE_RE = re.compile(r'\s+')
 
 def extract_license_data_from_pdf(pdf_path):
     """Extract all plumber license data from PDF"""
@@ -32,15 +39,13 @@ def extract_license_data_from_pdf(pdf_path):
                     continue
                 
                 # Look for lines that start with L101 (license pattern)
-                if line.strip().startswith('L101'):
-                    parts = line.split()
-                    
+                if line.lstrip().startswith('L101'):
                     # Extract phone number
-                    phone_match = re.search(r'(\d{3}-\d{3}-\d{4})', line)
+                    phone_match = PHONE_RE.search(line)
                     phone = phone_match.group(1) if phone_match else None
                     
                     # Extract email
-                    email_match = re.search(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', line)
+                    email_match = EMAIL_RE.search(line)
                     email = email_match.group(1).lower() if email_match else None
                     
                     # Extract company name (between APPROVED and address/phone)
@@ -49,7 +54,7 @@ def extract_license_data_from_pdf(pdf_path):
                         after_approved = line[approved_idx + 8:].strip()
                         
                         # Find where address starts (numbers followed by text)
-                        address_match = re.search(r'\d+\s+[A-Z]', after_approved)
+                        address_match = ADDRESS_RE.search(after_approved)
                         if address_match:
                             company_name = after_approved[:address_match.start()].strip()
                         else:
@@ -62,7 +67,7 @@ def extract_license_data_from_pdf(pdf_path):
                                 company_name = after_approved.strip()
                         
                         # Clean up company name
-                        company_name = re.sub(r'\s+', ' ', company_name)
+                        company_name = WHITESPACE_RE.sub(' ', company_name)
                         
                         if company_name and (phone or email):
                             licenses.append({
@@ -74,16 +79,13 @@ def extract_license_data_from_pdf(pdf_path):
     print(f"Extracted {len(licenses)} license records with contact info")
     return pd.DataFrame(licenses)
 
-def normalize_company_name(name):
-    """Normalize company name for matching"""
-    if pd.isna(name):
-        return ""
-    
-    # Convert to uppercase
-    name = str(name).upper()
+def normalize_company_names(names):
+    """Normalize a Series of company names for matching"""
+    # Convert to uppercase (missing names become empty strings)
+    names = names.fillna('').astype(str).str.upper()
     
     # Remove common punctuation
-    name = re.sub(r'[.,\'"&-]', ' ', name)
+    names = names.str.replace(r'[.,\'"&-]', ' ', regex=True)
     
     # Standardize common abbreviations
     replacements = {
@@ -92,57 +94,94 @@ def normalize_company_name(name):
         ' LIMITED LIABILITY COMPANY': ' LLC',
         ' LIMITED': ' LTD',
         ' COMPANY': ' CO',
-        ' AND ': ' & ',
-        'PLUMBING': 'PLUMBING',
-        'HEATING': 'HEATING',
-        'MECHANICAL': 'MECHANICAL'
+        ' AND ': ' & '
     }
     
     for old, new in replacements.items():
-        name = name.replace(old, new)
+        names = names.str.replace(old, new, regex=False)
     
     # Remove extra spaces
-    name = ' '.join(name.split())
-    
-    return name
+    return names.str.replace(r'\s+', ' ', regex=True).str.strip()
 
-def fuzzy_match_companies(permit_name, license_name, threshold=0.85):
-    """Check if two company names are a fuzzy match"""
-    # Normalize both names
-    norm_permit = normalize_company_name(permit_name)
-    norm_license = normalize_company_name(license_name)
-    
-    # Exact match after normalization
-    if norm_permit == norm_license:
-        return True, 1.0
-    
-    # Calculate similarity
-    similarity = SequenceMatcher(None, norm_permit, norm_license).ratio()
+# Corporate suffixes stripped to compare core business names
+CORE_WORDS_RE = r'\b(?:INC|LLC|CORP|LTD|CO|COMPANY|CORPORATION|LIMITED)\b'
+
+def core_company_names(norm_names):
+    """Strip corporate suffixes (INC, LLC, etc) from a Series of normalized company names"""
+    return norm_names.str.replace(CORE_WORDS_RE, '', regex=True).str.replace(r'\s+', ' ', regex=True).str.strip()
+
+def fuzzy_match_scores(norm_permit, permit_core, norm_license, license_core, threshold=0.85):
+    """Score every pair of normalized company names, 0 where the names are not a fuzzy match"""
+    # Calculate similarity for all pairs (exact matches after normalization score 1.0)
+    similarity = process.cdist(norm_permit, norm_license, scorer=fuzz.ratio,
+                               dtype=np.float64, workers=-1) / 100
     
     # Check if one name contains the other (for subsidiaries)
-    if norm_permit in norm_license or norm_license in norm_permit:
-        similarity = max(similarity, 0.9)
+    contains = process.cdist(norm_permit, norm_license, scorer=fuzz.partial_ratio,
+                             score_cutoff=100, dtype=np.float64, workers=-1) == 100
+    similarity = np.where(contains, np.maximum(similarity, 0.9), similarity)
     
-    # Special case for very similar names
-    if similarity >= threshold:
-        return True, similarity
+    # Check core business name for pairs below the threshold
+    core_similarity = process.cdist(permit_core, license_core, scorer=fuzz.ratio,
+                                    dtype=np.float64, workers=-1) / 100
+    has_core = np.array([bool(c) for c in permit_core])[:, None] & np.array([bool(c) for c in license_core])
+    core_similarity = np.where(has_core & (core_similarity >= 0.9), core_similarity, 0.0)
     
-    # Check core business name (remove INC, LLC, etc)
-    core_words = ['INC', 'LLC', 'CORP', 'LTD', 'CO', 'COMPANY', 'CORPORATION', 'LIMITED']
-    
-    permit_core = norm_permit
-    license_core = norm_license
-    
-    for word in core_words:
-        permit_core = permit_core.replace(word, '').strip()
-        license_core = license_core.replace(word, '').strip()
-    
-    if permit_core and license_core:
-        core_similarity = SequenceMatcher(None, permit_core, license_core).ratio()
-        if core_similarity >= 0.9:
-            return True, core_similarity
-    
-    return False, similarity
+    return np.where(similarity >= threshold, similarity, core_similarity)
+
+def match_license_companies(permit_names, license_names, threshold=0.85):
+    """Find the best matching license position and score for each permit company (-1, 0 if none)"""
+    # Nothing can match an empty license table
+    if len(license_names) == 0:
+        return np.full(len(permit_names), -1), np.zeros(len(permit_names))
+    
+    # Normalize each name and strip it to its core business name once
+    norm_permit = normalize_company_names(permit_names)
+    norm_license = normalize_company_names(license_names)
+    permit_core = core_company_names(norm_permit).tolist()
+    license_core = core_company_names(norm_license).tolist()
+    norm_permit = norm_permit.tolist()
+    norm_license = norm_license.tolist()
+    
+    best_idx = np.full(len(norm_permit), -1)
+    best_score = np.zeros(len(norm_permit))
+    
+    def score_against(permit_rows, license_rows):
+        scores = fuzzy_match_scores([norm_permit[i] for i in permit_rows],
+                                    [permit_core[i] for i in permit_rows],
+                                    [norm_license[i] for i in license_rows],
+                                    [license_core[i] for i in license_rows], threshold)
+        # First license wins ties
+        best = scores.argmax(axis=1)
+        best_score[permit_rows] = scores[np.arange(len(permit_rows)), best]
+        best_idx[permit_rows] = np.where(best_score[permit_rows] > 0, np.asarray(license_rows)[best], -1)
+    
+    # Resolve exact matches after normalization with a hash lookup (first license wins)
+    license_positions = pd.Series(np.arange(len(norm_license)), index=norm_license)
+    license_positions = license_positions[~license_positions.index.duplicated()]
+    exact_idx = license_positions.reindex(norm_permit).to_numpy()
+    is_exact = ~np.isnan(exact_idx) & (np.array(norm_permit) != '')
+    best_idx[is_exact] = exact_idx[is_exact]
+    best_score[is_exact] = 1.0
+    
+    # Block the remaining companies and all licenses on the first word of the normalized name
+    license_blocks = defaultdict(list)
+    for i, name in enumerate(norm_license):
+        license_blocks[name.split(' ', 1)[0]].append(i)
+    permit_blocks = defaultdict(list)
+    for i in np.flatnonzero(~is_exact):
+        permit_blocks[norm_permit[i].split(' ', 1)[0]].append(i)
+    
+    for token, permit_rows in permit_blocks.items():
+        if token in license_blocks:
+            score_against(permit_rows, license_blocks[token])
+    
+    # Fall back to a full scan for companies with no match in their block
+    unmatched = np.flatnonzero(best_idx < 0)
+    if len(unmatched) and len(norm_license):
+        score_against(unmatched, range(len(norm_license)))
+    
+    return best_idx, best_score
 
 def match_and_update_contacts():
     """Match permit data with license data and update contact information"""
@@ -152,75 +191,47 @@ def match_and_update_contacts():
     df = pd.read_csv('plumber_contacts_active_last_year_with_contact_info.csv')
     print(f"Loaded {len(df)} active plumbers")
     
-    # Extract license data
-    license_df = extract_license_data_from_pdf('PLumbingLicenses.pdf')
+    # Extract license data (reused from cache while the PDF is unchanged)
+    license_df = cached_by_file_hash('PLumbingLicenses.pdf', 'license_data', extract_license_data_from_pdf)
     
-    # Track matches
-    match_stats = {
-        'exact_matches': 0,
-        'fuzzy_matches': 0,
-        'no_matches': 0,
-        'phone_added': 0,
-        'email_added': 0
-    }
-    
-    # Create columns for tracking
-    df['Matched_License_Company'] = None
-    df['Match_Confidence'] = None
-    df['License_Phone'] = None
-    df['License_Email'] = None
+    # An empty or unparseable PDF yields a frame without columns; keep the expected ones so nothing matches
+    if license_df.empty:
+        license_df = pd.DataFrame(columns=['license_company', 'license_phone', 'license_email'])
     
     print("\nMatching companies...")
     
-    for idx, row in df.iterrows():
-        permit_company = row['Company_Name']
-        best_match = None
-        best_score = 0
-        
-        # Try to find a match in license data
-        for _, license_row in license_df.iterrows():
-            is_match, score = fuzzy_match_companies(permit_company, license_row['license_company'])
-            
-            if is_match and score > best_score:
-                best_match = license_row
-                best_score = score
-        
-        # Update data if match found
-        if best_match is not None:
-            df.at[idx, 'Matched_License_Company'] = best_match['license_company']
-            df.at[idx, 'Match_Confidence'] = f"{best_score:.2f}"
-            
-            if best_match['license_phone']:
-                df.at[idx, 'License_Phone'] = best_match['license_phone']
-                match_stats['phone_added'] += 1
-                
-            if best_match['license_email']:
-                df.at[idx, 'License_Email'] = best_match['license_email']
-                match_stats['email_added'] += 1
-            
-            if best_score == 1.0:
-                match_stats['exact_matches'] += 1
-            else:
-                match_stats['fuzzy_matches'] += 1
-        else:
-            match_stats['no_matches'] += 1
+    best_idx, best_score = match_license_companies(df['Company_Name'], license_df['license_company'])
+    matched = best_idx >= 0
+    # Unmatched positions (-1) come back as empty rows, which also covers an empty license table
+    best_license = license_df.reset_index(drop=True).reindex(best_idx)
+    
+    df['Matched_License_Company'] = np.where(matched, best_license['license_company'].to_numpy(), None)
+    df['Match_Confidence'] = np.where(matched, [f"{score:.2f}" for score in best_score], None)
+    df['License_Phone'] = np.where(matched, best_license['license_phone'].to_numpy(), None)
+    df['License_Email'] = np.where(matched, best_license['license_email'].to_numpy(), None)
+    
+    # Track matches
+    exact_matches = int((best_score == 1.0).sum())
+    match_stats = {
+        'exact_matches': exact_matches,
+        'fuzzy_matches': int(matched.sum()) - exact_matches,
+        'no_matches': int((~matched).sum()),
+        'phone_added': int(df['License_Phone'].notna().sum()),
+        'email_added': int(df['License_Email'].notna().sum())
+    }
     
     # Update the main phone and email columns
     # Use license data where available, otherwise keep generated emails
     df['Phone_Number'] = df['License_Phone']
-    df['Email'] = df.apply(lambda x: x['License_Email'] if pd.notna(x['License_Email']) 
-                           else x['Email'], axis=1)
+    df['Email'] = df['License_Email'].combine_first(df['Email'])
     
     # Update contact info source
-    df['Contact_Info_Source'] = df.apply(
-        lambda x: 'Licensed Data' if pd.notna(x['License_Phone']) or pd.notna(x['License_Email'])
-        else x['Contact_Info_Source'], axis=1
-    )
+    licensed = df['License_Phone'].notna() | df['License_Email'].notna()
+    df['Contact_Info_Source'] = df['Contact_Info_Source'].mask(licensed, 'Licensed Data')
     
     # Update confidence
-    df['Contact_Confidence'] = df.apply(
-        lambda x: 'High' if x['Contact_Info_Source'] == 'Licensed Data'
-        else x['Contact_Confidence'], axis=1
+    df['Contact_Confidence'] = df['Contact_Confidence'].mask(
+        df['Contact_Info_Source'] == 'Licensed Data', 'High'
     )
     
     # Sort by contact availability then permits
@@ -269,9 +280,8 @@ def match_and_update_contacts():
     print(f"\nSaved updated contacts to: {output_file}")
     
     # Create call-ready file (only with phone numbers)
-    call_ready = df[df['Phone_Number'].notna()].copy()
     call_ready_file = 'plumber_contacts_ready_to_call.csv'
-    call_ready.to_csv(call_ready_file, index=False)
+    df.loc[df['Phone_Number'].notna()].to_csv(call_ready_file, index=False)
     print(f"Saved call-ready list to: {call_ready_file}")
     
     # Print statistics
@@ -303,4 +313,10 @@ def match_and_update_contacts():
     return df
 
 if __name__ == "__main__":
-    match_and_update_contacts()
\ No newline at end of file
+    if outputs_up_to_date(
+        ['plumber_contacts_with_verified_info.csv', 'plumber_contacts_ready_to_call.csv'],
+        ['plumber_contacts_active_last_year_with_contact_info.csv', 'PLumbingLicenses.pdf', __file__]
+    ):
+        print("Verified contact files are up to date (pass --force to rebuild)")
+    else:
+        match_and_update_contacts()
\ No newline at end of file
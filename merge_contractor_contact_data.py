@@ -5,6 +5,7 @@ Merge verified contact information with existing plumbing contractor data
 
 import pandas as pd
 import os
+from pipeline_cache import outputs_up_to_date
 
 def merge_contractor_contacts():
     """Merge verified contact data with plumbing applicant data"""
@@ -34,6 +35,13 @@ def merge_contractor_contacts():
     contacts_df['normalized_name'] = contacts_df['Company_Name'].str.upper().str.strip()
     applicants_df['normalized_name'] = applicants_df['applicant_name'].str.upper().str.strip()
     
+    # Share one categorical dtype so the merge compares integer codes
+    name_dtype = pd.CategoricalDtype(
+        pd.concat([contacts_df['normalized_name'], applicants_df['normalized_name']]).dropna().unique()
+    )
+    contacts_df['normalized_name'] = contacts_df['normalized_name'].astype(name_dtype)
+    applicants_df['normalized_name'] = applicants_df['normalized_name'].astype(name_dtype)
+    
     # Merge the data
     print("\nMerging contact information...")
     merged_df = applicants_df.merge(
@@ -80,4 +88,12 @@ def merge_contractor_contacts():
     return merged_df
 
 if __name__ == "__main__":
-    merge_contractor_contacts()
\ No newline at end of file
+    if outputs_up_to_date(
+        ['reports/drill_down_reports/data/plumbing_contractors_with_contacts.csv',
+         'reports/drill_down_reports/data/plumbing_contractors_call_list.csv'],
+        ['plumber_contacts_with_verified_info.csv',
+         'reports/drill_down_reports/data/plumbing_all_applicants.csv', __file__]
+    ):
+        print("Merged contractor files are up to date (pass --force to rebuild)")
+    else:
+        merge_contractor_contacts()
\ No newline at end of file
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Helpers for skipping pipeline steps whose inputs have not changed
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+
+CACHE_DIR = 'cache'
+
+def outputs_up_to_date(outputs, inputs):
+    """Check that every output exists and is newer than every existing input"""
+    if '--force' in sys.argv[1:]:
+        return False
+
+    if not all(os.path.exists(path) for path in outputs):
+        return False
+
+    newest_input = max((os.path.getmtime(path) for path in inputs if os.path.exists(path)), default=0)
+    return min(os.path.getmtime(path) for path in outputs) > newest_input
+
+def file_hash(path):
+    """MD5 hex digest of a file's contents"""
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cached_by_file_hash(source_path, cache_name, build):
+    """Return build(source_path), reusing a pickled result while the source file and build code are unchanged"""
+    cache_path = os.path.join(CACHE_DIR, f'{cache_name}.pkl')
+    source_hash = file_hash(source_path)
+    # The module defining build counts too, so edits to the extraction code invalidate the cache
+    code_hash = file_hash(inspect.getsourcefile(build))
+
+    if '--force' not in sys.argv[1:] and os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['source_hash'] == source_hash and cached.get('code_hash') == code_hash:
+            print(f"Using cached data for {source_path}")
+            return cached['value']
+
+    value = build(source_path)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        pickle.dump({'source_hash': source_hash, 'code_hash': code_hash, 'value': value}, f)
+
+    return value
@@ -4,45 +4,28 @@ Remove the License Contact Person column from the dashboard since it's always "N
 """
 
 import pandas as pd
+import numpy as np
 import json
+import os
 
-def generate_dashboard_without_license_contact():
-    """Generate the HTML dashboard without the license contact column"""
-    
-    # Load the original data (before dual contacts)
-    df = pd.read_csv('plumber_contacts_with_verified_info.csv')
-    
-    # Prepare JavaScript data
-    contractors_data = []
-    for _, row in df.iterrows():
-        contractors_data.append({
-            'company': row['Company_Name'],
-            'contact': row['Contact_Person'] if pd.notna(row['Contact_Person']) else '',
-            'phone': row['Phone_Number'] if pd.notna(row['Phone_Number']) else '',
-            'email': row['Email'] if pd.notna(row['Email']) else '',
-            'permits': int(row['Total_Permits']),
-            'lastPermit': str(row['Last_Permit_Date'])[:10] if pd.notna(row['Last_Permit_Date']) else '',
-            'activityLevel': row['Activity_Level'] if pd.notna(row['Activity_Level']) else '',
-            'daysSince': int(row['Days_Since_Last_Permit']) if pd.notna(row['Days_Since_Last_Permit']) else 999,
-            'source': row['Contact_Info_Source'] if pd.notna(row['Contact_Info_Source']) else 'Generated',
-            'confidence': row['Contact_Confidence'] if pd.notna(row['Contact_Confidence']) else 'Low'
-        })
-    
-    # Calculate statistics
-    total_contractors = len(df)
-    with_phone = df['Phone_Number'].notna().sum()
-    with_email = df['Email'].notna().sum()
-    with_both = (df['Phone_Number'].notna() & df['Email'].notna()).sum()
-    
-    # Generate HTML
-    html_content = f'''<!DOCTYPE html>
+# Columns of the verified contact data used by the dashboard
+CONTACT_COLUMNS = [
+    'Company_Name', 'Contact_Person', 'Phone_Number', 'Email', 'Total_Permits', 'Last_Permit_Date',
+    'Activity_Level', 'Days_Since_Last_Permit', 'Contact_Info_Source', 'Contact_Confidence'
+]
+
+# Activity level text -> integer code used by the page script (first match wins, -1 when none)
+ACTIVITY_CODES = {'Very Active': 4, 'Active (30-90': 3, 'Moderate': 2, 'Low': 1, 'Inactive': 0}
+
+# Static page pieces; only the stat cards and the contractor data vary per run
+DASHBOARD_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Plumbing Contractor Contact Dashboard</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;
             line-height: 1.6;
             color: #333;
@@ -50,72 +33,72 @@ def generate_dashboard_without_license_contact():
             margin: 0 auto;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             background-color: white;
             padding: 40px;
             box-shadow: 0 0 20px rgba(0,0,0,0.1);
             border-radius: 8px;
-        }}
-        h1 {{
+        }
+        h1 {
             color: #1565c0;
             border-bottom: 3px solid #1565c0;
             padding-bottom: 10px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #424242;
             margin-top: 40px;
             border-bottom: 2px solid #e0e0e0;
             padding-bottom: 10px;
-        }}
-        .stat-grid {{
+        }
+        .stat-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin: 30px 0;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background-color: #f8f9fa;
             padding: 20px;
             border-radius: 8px;
             border-left: 4px solid #1565c0;
             text-align: center;
-        }}
-        .stat-value {{
+        }
+        .stat-value {
             font-size: 32px;
             font-weight: bold;
             color: #1565c0;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #666;
             font-size: 14px;
             margin-top: 5px;
-        }}
-        .success-card {{
+        }
+        .success-card {
             border-left-color: #4caf50;
-        }}
-        .success-card .stat-value {{
+        }
+        .success-card .stat-value {
             color: #4caf50;
-        }}
-        .warning-card {{
+        }
+        .warning-card {
             border-left-color: #ff9800;
-        }}
-        .warning-card .stat-value {{
+        }
+        .warning-card .stat-value {
             color: #ff9800;
-        }}
-        .filter-controls {{
+        }
+        .filter-controls {
             background-color: #f5f5f5;
             padding: 20px;
             border-radius: 8px;
             margin: 20px 0;
-        }}
-        .filter-controls input, .filter-controls select {{
+        }
+        .filter-controls input, .filter-controls select {
             padding: 8px;
             margin: 5px;
             border: 1px solid #ddd;
             border-radius: 4px;
-        }}
-        .download-btn {{
+        }
+        .download-btn {
             background-color: #4caf50;
             color: white;
             padding: 10px 20px;
@@ -125,91 +108,91 @@ def generate_dashboard_without_license_contact():
             text-decoration: none;
             display: inline-block;
             margin: 10px 5px;
-        }}
-        .download-btn:hover {{
+        }
+        .download-btn:hover {
             background-color: #45a049;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
             font-size: 14px;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #ddd;
-        }}
-        th {{
+        }
+        th {
             background-color: #f8f9fa;
             font-weight: 600;
             color: #555;
             cursor: pointer;
             user-select: none;
-        }}
-        th:hover {{
+        }
+        th:hover {
             background-color: #e9ecef;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f8f9fa;
-        }}
-        .verified-contact {{
+        }
+        .verified-contact {
             background-color: #e8f5e9;
-        }}
-        .has-contact {{
+        }
+        .has-contact {
             background-color: #fff3e0;
-        }}
-        .no-contact {{
+        }
+        .no-contact {
             color: #999;
             font-style: italic;
-        }}
-        .contact-info {{
+        }
+        .contact-info {
             color: #1565c0;
             text-decoration: none;
-        }}
-        .contact-info:hover {{
+        }
+        .contact-info:hover {
             text-decoration: underline;
-        }}
-        .activity-badge {{
+        }
+        .activity-badge {
             padding: 4px 8px;
             border-radius: 4px;
             font-size: 12px;
             font-weight: 500;
-        }}
-        .activity-very-active {{
+        }
+        .activity-very-active {
             background-color: #4caf50;
             color: white;
-        }}
-        .activity-active {{
+        }
+        .activity-active {
             background-color: #8bc34a;
             color: white;
-        }}
-        .activity-moderate {{
+        }
+        .activity-moderate {
             background-color: #ff9800;
             color: white;
-        }}
-        .activity-low {{
+        }
+        .activity-low {
             background-color: #ff5722;
             color: white;
-        }}
-        .activity-inactive {{
+        }
+        .activity-inactive {
             background-color: #9e9e9e;
             color: white;
-        }}
-        .source-badge {{
+        }
+        .source-badge {
             padding: 4px 8px;
             border-radius: 4px;
             font-size: 12px;
             font-weight: 500;
-        }}
-        .source-licensed {{
+        }
+        .source-licensed {
             background-color: #2196f3;
             color: white;
-        }}
-        .source-generated {{
+        }
+        .source-generated {
             background-color: #9e9e9e;
             color: white;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -225,29 +208,9 @@ def generate_dashboard_without_license_contact():
         <h1>Plumbing Contractor Contact Dashboard</h1>
         <p style="color: #666;">Verified contact information from Minnesota plumbing license database matched with permit data</p>
         
-        <div class="stat-grid">
-            <div class="stat-card">
-                <div class="stat-value" id="totalContractors">{total_contractors}</div>
-                <div class="stat-label">Total Contractors</div>
-            </div>
-            <div class="stat-card success-card">
-                <div class="stat-value" id="withPhone">{with_phone}</div>
-                <div class="stat-label">With Phone Numbers</div>
-            </div>
-            <div class="stat-card success-card">
-                <div class="stat-value" id="withEmail">{with_email}</div>
-                <div class="stat-label">With Email Addresses</div>
-            </div>
-            <div class="stat-card warning-card">
-                <div class="stat-value" id="withBoth">{with_both}</div>
-                <div class="stat-label">With Both</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">42.4%</div>
-                <div class="stat-label">Match Success Rate</div>
-            </div>
-        </div>
+'''
 
+DASHBOARD_CONTROLS = '''
         <div class="filter-controls">
             <input type="text" id="searchBox" placeholder="Search contractors, emails, phones..." style="width: 300px;">
             <select id="contactFilter">
@@ -274,12 +237,12 @@ def generate_dashboard_without_license_contact():
         <table id="contractorTable">
             <thead>
                 <tr>
-                    <th onclick="sortTable('company')">Company Name ↕</th>
-                    <th onclick="sortTable('contact')">Contact Person ↕</th>
+                    <th data-sort="company">Company Name ↕</th>
+                    <th data-sort="contact">Contact Person ↕</th>
                     <th>Phone</th>
                     <th>Email</th>
-                    <th onclick="sortTable('permits')">Permits ↕</th>
-                    <th onclick="sortTable('lastPermit')">Last Permit ↕</th>
+                    <th data-sort="permits">Permits ↕</th>
+                    <th data-sort="lastPermit">Last Permit ↕</th>
                     <th>Activity Level</th>
                     <th>Source</th>
                 </tr>
@@ -287,151 +250,212 @@ def generate_dashboard_without_license_contact():
             <tbody id="tableBody">
             </tbody>
         </table>
+        <div id="loadMoreSentinel"></div>
     </div>
 
     <script>
         // Contractor data
-        const contractorData = {json.dumps(contractors_data, indent=2)};
+        const contractorColumns = '''
+
+DASHBOARD_SCRIPT = ''';
+
+        // Rebuild one record per contractor from the columnar payload
+        const contractorData = contractorColumns.company.map((_, i) => {
+            const contractor = {};
+            for (const key in contractorColumns) contractor[key] = contractorColumns[key][i];
+            return contractor;
+        });
+
+        // Badge class (and activity filter value) for each activityCode
+        const ACTIVITY_CLASSES = ['inactive', 'low', 'moderate', 'active', 'very-active'];
+
+        // Contractor fields are plain text, so escape them before building row markup
+        const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+        function escapeHtml(value) {
+            return String(value).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+        }
+
+        // Row markup and search text depend only on the contractor, so build them once up front
+        contractorData.forEach(contractor => {
+            contractor.rowHtml = renderRow(contractor);
+            contractor.searchText = [contractor.company, contractor.contact, contractor.phone, contractor.email]
+                .join('\\n').toLowerCase();
+        });
+
+        // Rows are appended in batches as the end of the table scrolls into view
+        const ROW_BATCH_SIZE = 200;
+        const loadMoreObserver = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) appendRows();
+        });
+        let renderedData = [];
+        let renderedCount = 0;
 
         // Initialize
-        let currentData = [...contractorData];
+        let currentData = contractorData;
         populateTable(currentData);
         updateStats();
 
-        function populateTable(data) {{
-            const tbody = document.getElementById('tableBody');
-            tbody.innerHTML = '';
+        function renderRow(contractor) {
+            const activityClass = ACTIVITY_CLASSES[contractor.activityCode] || 'inactive';
+            const sourceClass = contractor.source === 'Licensed Data' ? 'licensed' : 'generated';
+            
+            const phone = escapeHtml(contractor.phone);
+            const email = escapeHtml(contractor.email);
+            const phoneCell = contractor.phone
+                ? `<a href="tel:${phone}" class="contact-info">${phone}</a>`
+                : '<span class="no-contact">No phone</span>';
+            const emailCell = contractor.email
+                ? `<a href="mailto:${email}" class="contact-info">${email}</a>`
+                : '<span class="no-contact">No email</span>';
+            
+            return `<tr>
+                <td>${escapeHtml(contractor.company)}</td>
+                <td>${escapeHtml(contractor.contact || 'N/A')}</td>
+                <td>${phoneCell}</td>
+                <td>${emailCell}</td>
+                <td>${contractor.permits.toLocaleString()}</td>
+                <td>${escapeHtml(contractor.lastPermit)}</td>
+                <td><span class="activity-badge activity-${activityClass}">${escapeHtml(contractor.activityLevel)}</span></td>
+                <td><span class="source-badge source-${sourceClass}">${escapeHtml(contractor.source)}</span></td>
+            </tr>`;
+        }
+
+        function populateTable(data) {
+            renderedData = data;
+            renderedCount = 0;
+            document.getElementById('tableBody').innerHTML = '';
+            appendRows();
+        }
+
+        function appendRows() {
+            // Join the cached rows so each batch is parsed in a single pass
+            const batch = renderedData.slice(renderedCount, renderedCount + ROW_BATCH_SIZE);
+            document.getElementById('tableBody').insertAdjacentHTML('beforeend', batch.map(contractor => contractor.rowHtml).join(''));
+            renderedCount += batch.length;
             
-            data.forEach(contractor => {{
-                const row = tbody.insertRow();
-                
-                // Determine activity class
-                let activityClass = 'inactive';
-                if (contractor.activityLevel.includes('Very Active')) activityClass = 'very-active';
-                else if (contractor.activityLevel.includes('Active (30-90')) activityClass = 'active';
-                else if (contractor.activityLevel.includes('Moderate')) activityClass = 'moderate';
-                else if (contractor.activityLevel.includes('Low')) activityClass = 'low';
-                
-                // Determine source class
-                const sourceClass = contractor.source === 'Licensed Data' ? 'licensed' : 'generated';
-                
-                // Build phone cell
-                let phoneCell = '<span class="no-contact">No phone</span>';
-                if (contractor.phone) {{
-                    phoneCell = `<a href="tel:${{contractor.phone}}" class="contact-info">${{contractor.phone}}</a>`;
-                }}
-                
-                // Build email cell
-                let emailCell = '<span class="no-contact">No email</span>';
-                if (contractor.email) {{
-                    emailCell = `<a href="mailto:${{contractor.email}}" class="contact-info">${{contractor.email}}</a>`;
-                }}
-                
-                row.innerHTML = `
-                    <td>${{contractor.company}}</td>
-                    <td>${{contractor.contact || 'N/A'}}</td>
-                    <td>${{phoneCell}}</td>
-                    <td>${{emailCell}}</td>
-                    <td>${{contractor.permits.toLocaleString()}}</td>
-                    <td>${{contractor.lastPermit}}</td>
-                    <td><span class="activity-badge activity-${{activityClass}}">${{contractor.activityLevel}}</span></td>
-                    <td><span class="source-badge source-${{sourceClass}}">${{contractor.source}}</span></td>
-                `;
-            }});
-        }}
+            // Re-observing reports the sentinel's current visibility, so a short batch keeps loading
+            const sentinel = document.getElementById('loadMoreSentinel');
+            loadMoreObserver.unobserve(sentinel);
+            if (renderedCount < renderedData.length) loadMoreObserver.observe(sentinel);
+        }
+
+        function updateStats() {
+            // Count all three contact stats in one pass over the filtered rows
+            let withPhone = 0, withEmail = 0, withBoth = 0;
+            for (const c of currentData) {
+                if (c.phone) withPhone++;
+                if (c.email) withEmail++;
+                if (c.phone && c.email) withBoth++;
+            }
+            document.getElementById('totalContractors').textContent = currentData.length;
+            document.getElementById('withPhone').textContent = withPhone;
+            document.getElementById('withEmail').textContent = withEmail;
+            document.getElementById('withBoth').textContent = withBoth;
+        }
 
-        function updateStats() {{
-            const filtered = currentData;
-            document.getElementById('totalContractors').textContent = filtered.length;
-            document.getElementById('withPhone').textContent = filtered.filter(c => c.phone).length;
-            document.getElementById('withEmail').textContent = filtered.filter(c => c.email).length;
-            document.getElementById('withBoth').textContent = filtered.filter(c => c.phone && c.email).length;
-        }}
+        // Sorting (one listener on the header row for every sortable column)
+        document.querySelector('#contractorTable thead').addEventListener('click', event => {
+            const header = event.target.closest('th[data-sort]');
+            if (header) sortTable(header.dataset.sort);
+        });
 
-        // Sorting
-        let sortOrder = {{}};
-        function sortTable(column) {{
+        let sortOrder = {};
+        function sortTable(column) {
             sortOrder[column] = !sortOrder[column];
             const ascending = sortOrder[column];
             
-            currentData.sort((a, b) => {{
-                let aVal = a[column];
-                let bVal = b[column];
-                
-                if (column === 'permits' || column === 'daysSince') {{
-                    aVal = parseInt(aVal) || 0;
-                    bVal = parseInt(bVal) || 0;
-                }}
-                
-                if (column === 'lastPermit') {{
-                    aVal = new Date(aVal || '1900-01-01');
-                    bVal = new Date(bVal || '1900-01-01');
-                }}
-                
-                if (aVal < bVal) return ascending ? -1 : 1;
-                if (aVal > bVal) return ascending ? 1 : -1;
+            // Extract each row's sort key once instead of on every comparison
+            const keyed = currentData.map(contractor => {
+                let key = contractor[column];
+                if (column === 'permits' || column === 'daysSince') {
+                    key = parseInt(key) || 0;
+                } else if (column === 'lastPermit') {
+                    key = Date.parse(key || '1900-01-01');
+                }
+                return { key, contractor };
+            });
+            
+            keyed.sort((a, b) => {
+                if (a.key < b.key) return ascending ? -1 : 1;
+                if (a.key > b.key) return ascending ? 1 : -1;
                 return 0;
-            }});
+            });
+            currentData = keyed.map(entry => entry.contractor);
             
             populateTable(currentData);
-        }}
+        }
 
         // Filtering
         document.getElementById('contactFilter').addEventListener('change', applyFilters);
         document.getElementById('activityFilter').addEventListener('change', applyFilters);
-        document.getElementById('searchBox').addEventListener('input', applyFilters);
 
-        function applyFilters() {{
+        // Wait for a pause in typing before re-filtering
+        let searchTimer;
+        document.getElementById('searchBox').addEventListener('input', () => {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(applyFilters, 150);
+        });
+
+        function applyFilters() {
             const contactFilter = document.getElementById('contactFilter').value;
             const activityFilter = document.getElementById('activityFilter').value;
             const searchTerm = document.getElementById('searchBox').value.toLowerCase();
             
-            let filtered = [...contractorData];
+            let filtered = contractorData;
             
             // Contact filter
-            if (contactFilter === 'with-phone') {{
+            if (contactFilter === 'with-phone') {
                 filtered = filtered.filter(c => c.phone);
-            }} else if (contactFilter === 'with-email') {{
+            } else if (contactFilter === 'with-email') {
                 filtered = filtered.filter(c => c.email);
-            }} else if (contactFilter === 'with-both') {{
+            } else if (contactFilter === 'with-both') {
                 filtered = filtered.filter(c => c.phone && c.email);
-            }} else if (contactFilter === 'verified') {{
+            } else if (contactFilter === 'verified') {
                 filtered = filtered.filter(c => c.source === 'Licensed Data');
-            }} else if (contactFilter === 'no-contact') {{
+            } else if (contactFilter === 'no-contact') {
                 filtered = filtered.filter(c => !c.phone && !c.email);
-            }}
+            }
             
             // Activity filter
-            if (activityFilter !== 'all') {{
-                const activityMap = {{
-                    'very-active': 'Very Active',
-                    'active': 'Active (30-90',
-                    'moderate': 'Moderate',
-                    'low': 'Low',
-                    'inactive': 'Inactive'
-                }};
-                filtered = filtered.filter(c => c.activityLevel.includes(activityMap[activityFilter]));
-            }}
+            if (activityFilter !== 'all') {
+                const activityCode = ACTIVITY_CLASSES.indexOf(activityFilter);
+                filtered = filtered.filter(c => c.activityCode === activityCode);
+            }
             
             // Search filter
-            if (searchTerm) {{
-                filtered = filtered.filter(c => 
-                    c.company.toLowerCase().includes(searchTerm) ||
-                    (c.contact && c.contact.toLowerCase().includes(searchTerm)) ||
-                    (c.phone && c.phone.includes(searchTerm)) ||
-                    (c.email && c.email.toLowerCase().includes(searchTerm))
-                );
-            }}
+            if (searchTerm) {
+                filtered = filtered.filter(c => c.searchText.includes(searchTerm));
+            }
             
             currentData = filtered;
             populateTable(currentData);
             updateStats();
-        }}
+        }
 
         // Download functions
-        function downloadCSV() {{
+        function csvCell(value) {
+            return `"${String(value).replace(/"/g, '""')}"`;
+        }
+
+        function toCSVBlob(headers, rows) {
+            // Hand the Blob one part per line instead of joining the whole file into one string
+            const parts = [headers.map(csvCell).join(',')];
+            for (const row of rows) parts.push('\\n' + row.map(csvCell).join(','));
+            return new Blob(parts, { type: 'text/csv' });
+        }
+
+        function downloadRows(filePrefix, headers, rows) {
+            const url = window.URL.createObjectURL(toCSVBlob(headers, rows));
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = filePrefix + '_' + new Date().toISOString().split('T')[0] + '.csv';
+            a.click();
+            window.URL.revokeObjectURL(url);
+        }
+
+        function downloadCSV() {
             const headers = ['Company Name', 'Contact Person', 'Phone', 'Email', 'Total Permits', 'Last Permit', 'Activity Level', 'Days Since Last', 'Source', 'Confidence'];
-            const rows = currentData.map(c => [
+            downloadRows('plumber_contacts', headers, currentData.map(c => [
                 c.company,
                 c.contact || '',
                 c.phone || '',
@@ -442,23 +466,12 @@ def generate_dashboard_without_license_contact():
                 c.daysSince,
                 c.source,
                 c.confidence
-            ]);
-            
-            const csv = [headers, ...rows].map(row => row.map(cell => `"${{String(cell).replace(/"/g, '""')}}"`).join(',')).join('\\n');
-            
-            const blob = new Blob([csv], {{ type: 'text/csv' }});
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = 'plumber_contacts_' + new Date().toISOString().split('T')[0] + '.csv';
-            a.click();
-            window.URL.revokeObjectURL(url);
-        }}
+            ]));
+        }
 
-        function downloadCallList() {{
-            const callListData = currentData.filter(c => c.phone);
+        function downloadCallList() {
             const headers = ['Company Name', 'Contact Person', 'Phone', 'Email', 'Total Permits', 'Last Activity', 'Confidence'];
-            const rows = callListData.map(c => [
+            downloadRows('plumber_call_list', headers, currentData.filter(c => c.phone).map(c => [
                 c.company,
                 c.contact || '',
                 c.phone,
@@ -466,26 +479,87 @@ def generate_dashboard_without_license_contact():
                 c.permits,
                 c.activityLevel,
                 c.confidence
-            ]);
-            
-            const csv = [headers, ...rows].map(row => row.map(cell => `"${{String(cell).replace(/"/g, '""')}}"`).join(',')).join('\\n');
-            
-            const blob = new Blob([csv], {{ type: 'text/csv' }});
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = 'plumber_call_list_' + new Date().toISOString().split('T')[0] + '.csv';
-            a.click();
-            window.URL.revokeObjectURL(url);
-        }}
+            ]));
+        }
     </script>
 </body>
 </html>'''
+
+def activity_codes(activity_level):
+    """Map activity level text to the page script's integer activity codes"""
+    return np.select(
+        [activity_level.str.contains(text, regex=False) for text in ACTIVITY_CODES],
+        list(ACTIVITY_CODES.values()),
+        default=-1
+    )
+
+def generate_dashboard_without_license_contact():
+    """Generate the HTML dashboard without the license contact column"""
+    
+    # Load the original data (before dual contacts)
+    df = pd.read_csv('plumber_contacts_with_verified_info.csv', usecols=CONTACT_COLUMNS)
+    
+    has_phone = df['Phone_Number'].notna()
+    has_email = df['Email'].notna()
+    activity_level = df['Activity_Level'].fillna('')
+    
+    # Prepare JavaScript data as one list per field, so keys are not repeated for every contractor
+    contractor_columns = pd.DataFrame({
+        'company': df['Company_Name'],
+        'contact': df['Contact_Person'].fillna(''),
+        'phone': df['Phone_Number'].where(has_phone, ''),
+        'email': df['Email'].where(has_email, ''),
+        'permits': df['Total_Permits'].astype(int),
+        'lastPermit': df['Last_Permit_Date'].astype(str).str.slice(0, 10).where(df['Last_Permit_Date'].notna(), ''),
+        'activityLevel': activity_level,
+        'activityCode': activity_codes(activity_level),
+        'daysSince': df['Days_Since_Last_Permit'].fillna(999).astype(int),
+        'source': df['Contact_Info_Source'].fillna('Generated'),
+        'confidence': df['Contact_Confidence'].fillna('Low')
+    }).to_dict(orient='list')
+    
+    # Calculate statistics
+    total_contractors = len(df)
+    with_phone = has_phone.sum()
+    with_email = has_email.sum()
+    with_both = (has_phone & has_email).sum()
+    
+    # Stat cards are the only templated part of the page
+    stat_grid = f'''        <div class="stat-grid">
+            <div class="stat-card">
+                <div class="stat-value" id="totalContractors">{total_contractors}</div>
+                <div class="stat-label">Total Contractors</div>
+            </div>
+            <div class="stat-card success-card">
+                <div class="stat-value" id="withPhone">{with_phone}</div>
+                <div class="stat-label">With Phone Numbers</div>
+            </div>
+            <div class="stat-card success-card">
+                <div class="stat-value" id="withEmail">{with_email}</div>
+                <div class="stat-label">With Email Addresses</div>
+            </div>
+            <div class="stat-card warning-card">
+                <div class="stat-value" id="withBoth">{with_both}</div>
+                <div class="stat-label">With Both</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">42.4%</div>
+                <div class="stat-label">Match Success Rate</div>
+            </div>
+        </div>
+'''
     
-    # Save the dashboard
+    # Save the dashboard, writing the data straight to the file between the static pieces.
+    # Write to a temporary file first so readers never see a half-written dashboard.
     output_file = 'reports/drill_down_reports/contractor_contact_dashboard_live.html'
-    with open(output_file, 'w') as f:
-        f.write(html_content)
+    temp_file = output_file + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        f.write(DASHBOARD_HEAD)
+        f.write(stat_grid)
+        f.write(DASHBOARD_CONTROLS)
+        json.dump(contractor_columns, f, separators=(',', ':'))
+        f.write(DASHBOARD_SCRIPT)
+    os.replace(temp_file, output_file)
     
     print(f"Updated dashboard: {output_file}")
     print(f"Removed the License Contact Person column")
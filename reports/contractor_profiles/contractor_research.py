@@ -7,36 +7,84 @@ Gathers additional information about plumbing contractors from web sources
 import json
 import pandas as pd
 import os
+from pathlib import Path
 from datetime import datetime
 import re
 from typing import Dict, List, Optional
-import time
+from functools import lru_cache
+
+# Contractor CSV columns read by extract_existing_data
+CONTRACTOR_COLUMNS = {
+    'Company_Name', 'Matched_License_Company', 'Contact_Person', 'Phone_Number', 'Email',
+    'Address', 'City', 'Service_Areas', 'Total_Permits', 'Avg_Permits_Per_Year',
+    'First_Permit_Date', 'Last_Permit_Date', 'Days_Since_Last_Permit', 'Total_Fees_Paid',
+    'Activity_Level', 'Top_Work_Types', 'Contact_Info_Source', 'Contact_Confidence'
+}
+
+# Patterns used to build file names and search-friendly phone numbers
+NON_WORD_RE = re.compile(r'[^\w\s-]')
+SEPARATOR_RE = re.compile(r'[-\s]+')
+NON_DIGIT_RE = re.compile(r'\D')
+PLACEHOLDER_RE = re.compile(r'\{[A-Z_]+\}')
+
+# Social media keys and the link labels shown for them
+SOCIAL_PLATFORMS = (
+    ('facebook', 'Facebook'),
+    ('linkedin', 'LinkedIn'),
+    ('twitter', 'Twitter'),
+    ('instagram', 'Instagram'),
+    ('youtube', 'YouTube')
+)
+
+# Deletes the ASCII characters NON_WORD_RE would strip, for the common all-ASCII name
+ASCII_NON_WORD_TABLE = str.maketrans({chr(c): None for c in range(128) if NON_WORD_RE.match(chr(c))})
+
+
+@lru_cache(maxsize=4096)
+def clean_company_name(name: str) -> str:
+    """Clean company name for file naming"""
+    # Remove special characters and spaces
+    if name.isascii():
+        clean_name = name.translate(ASCII_NON_WORD_TABLE)
+    else:
+        clean_name = NON_WORD_RE.sub('', name)
+    clean_name = SEPARATOR_RE.sub('_', clean_name)
+    return clean_name.lower()
 
 
 class ContractorResearcher:
     def __init__(self, contractor_csv_path: str):
         """Initialize the researcher with contractor data"""
-        self.contractors_df = pd.read_csv(contractor_csv_path)
+        # Columns missing from the file are skipped; extract_existing_data falls back to defaults
+        self.contractors_df = pd.read_csv(contractor_csv_path, usecols=lambda col: col in CONTRACTOR_COLUMNS)
         self.template_path = "contractor_data_template.json"
         self.output_dir = "contractor_profiles"
         
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # One timestamp for every contractor processed in this run
+        self.run_timestamp = datetime.now().isoformat()
+        
         # Load the JSON template
         with open(self.template_path, 'r') as f:
             self.template = json.load(f)
+        
+        # Serialized once so each contractor gets a fresh copy with a single json.loads
+        self.template_json = json.dumps(self.template)
+        
+        # Load the HTML template once for every contractor page
+        template_html_path = os.path.join(os.path.dirname(self.output_dir), "contractor_detail_template.html")
+        with open(template_html_path, 'r') as f:
+            self.html_template = f.read()
     
     def clean_company_name(self, name: str) -> str:
         """Clean company name for file naming"""
-        # Remove special characters and spaces
-        clean_name = re.sub(r'[^\w\s-]', '', name)
-        clean_name = re.sub(r'[-\s]+', '_', clean_name)
-        return clean_name.lower()
+        return clean_company_name(name)
     
     def extract_existing_data(self, contractor_row) -> Dict:
         """Extract data we already have from the CSV"""
-        data = json.loads(json.dumps(self.template))  # Deep copy template
+        data = json.loads(self.template_json)  # Deep copy template
         
         # Company info
         data['company_info']['company_name'] = contractor_row['Company_Name']
@@ -69,7 +117,7 @@ class ContractorResearcher:
             ]
         
         # Metadata
-        data['metadata']['last_updated'] = datetime.now().isoformat()
+        data['metadata']['last_updated'] = self.run_timestamp
         data['metadata']['data_source'] = contractor_row.get('Contact_Info_Source', 'Minneapolis Permits Database')
         data['metadata']['verification_status'] = contractor_row.get('Contact_Confidence', 'Unverified')
         
@@ -78,7 +126,7 @@ class ContractorResearcher:
     def format_phone_for_search(self, phone: str) -> str:
         """Format phone number for web searches"""
         # Remove all non-numeric characters
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = NON_DIGIT_RE.sub('', phone)
         if len(digits_only) == 10:
             return f"({digits_only[:3]}) {digits_only[3:6]}-{digits_only[6:]}"
         return phone
@@ -104,7 +152,7 @@ class ContractorResearcher:
         
         # Add placeholder for web research results
         contractor_data['web_research']['research_notes'].append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self.run_timestamp,
             'action': 'Web research queries prepared',
             'queries': search_queries
         })
@@ -129,11 +177,6 @@ class ContractorResearcher:
     
     def create_contractor_html(self, contractor_data: Dict) -> str:
         """Generate HTML page for a contractor using the template"""
-        # Read the HTML template
-        template_html_path = os.path.join(os.path.dirname(self.output_dir), "contractor_detail_template.html")
-        with open(template_html_path, 'r') as f:
-            html_template = f.read()
-        
         # Format values for display
         def format_currency(value):
             try:
@@ -187,27 +230,19 @@ class ContractorResearcher:
             '{CALL_HISTORY}': self.format_call_history(contractor_data['interaction_history']['calls'])
         }
         
-        # Replace all placeholders
-        html_content = html_template
-        for placeholder, value in replacements.items():
-            html_content = html_content.replace(placeholder, str(value))
-        
-        return html_content
+        # Replace all placeholders in a single pass over the template
+        return PLACEHOLDER_RE.sub(
+            lambda match: str(replacements.get(match.group(0), match.group(0))),
+            self.html_template
+        )
     
     def format_social_media_links(self, social_media: Dict) -> str:
         """Format social media links for display"""
-        links = []
-        platforms = {
-            'facebook': 'Facebook',
-            'linkedin': 'LinkedIn',
-            'twitter': 'Twitter',
-            'instagram': 'Instagram',
-            'youtube': 'YouTube'
-        }
-        
-        for platform, label in platforms.items():
-            if social_media.get(platform):
-                links.append(f'<a href="{social_media[platform]}" target="_blank">{label}</a>')
+        links = [
+            f'<a href="{social_media[platform]}" target="_blank">{label}</a>'
+            for platform, label in SOCIAL_PLATFORMS
+            if social_media.get(platform)
+        ]
         
         return ' | '.join(links) if links else 'Not Available'
     
@@ -216,9 +251,7 @@ class ContractorResearcher:
         if not reviews:
             return '<div class="review-item"><p>No reviews available yet.</p></div>'
         
-        html_parts = []
-        for review in reviews[:5]:  # Show only top 5 reviews
-            html_parts.append(f'''
+        return ''.join(f'''
                 <div class="review-item">
                     <div class="review-header">
                         <span class="review-rating">★★★★★ {review.get('rating', 'N/A')}/5</span>
@@ -226,18 +259,15 @@ class ContractorResearcher:
                     </div>
                     <p class="review-text">"{review.get('text', 'No review text available.')}"</p>
                 </div>
-            ''')
-        
-        return ''.join(html_parts)
+            ''' for review in reviews[:5])  # Show only top 5 reviews
     
     def format_notes_history(self, notes: List) -> str:
         """Format notes history for HTML display"""
         if not notes:
             return '<div class="note-entry"><p>No notes yet. Add your first note above!</p></div>'
         
-        html_parts = []
-        for note in notes[-5:]:  # Show last 5 notes
-            html_parts.append(f'''
+        # Show last 5 notes, newest first
+        return ''.join(f'''
                 <div class="note-entry">
                     <div class="note-header">
                         <span>{note.get('date', 'Unknown date')}</span>
@@ -245,26 +275,20 @@ class ContractorResearcher:
                     </div>
                     <p class="note-content">{note.get('content', '')}</p>
                 </div>
-            ''')
-        
-        return ''.join(reversed(html_parts))  # Show newest first
+            ''' for note in reversed(notes[-5:]))
     
     def format_call_history(self, calls: List) -> str:
         """Format call history for HTML display"""
         if not calls:
             return '<div class="call-entry"><span>No calls logged yet</span></div>'
         
-        html_parts = []
-        for call in calls[-10:]:  # Show last 10 calls
-            status_class = call.get('status', 'unknown').lower().replace(' ', '-')
-            html_parts.append(f'''
+        # Show last 10 calls, newest first
+        return ''.join(f'''
                 <div class="call-entry">
                     <span>{call.get('date', 'Unknown date')} - {call.get('time', '')}</span>
-                    <span class="call-status {status_class}">{call.get('status', 'Unknown')}</span>
+                    <span class="call-status {call.get('status', 'unknown').lower().replace(' ', '-')}">{call.get('status', 'Unknown')}</span>
                 </div>
-            ''')
-        
-        return ''.join(reversed(html_parts))  # Show newest first
+            ''' for call in reversed(calls[-10:]))
     
     def process_contractor(self, contractor_row, output_json=True, output_html=True) -> Dict:
         """Process a single contractor"""
@@ -282,18 +306,26 @@ class ContractorResearcher:
         # Save JSON data
         if output_json:
             json_path = os.path.join(self.output_dir, f"{clean_name}_data.json")
-            with open(json_path, 'w') as f:
-                json.dump(contractor_data, f, indent=2)
+            Path(json_path).write_text(json.dumps(contractor_data, indent=2), encoding='utf-8')
             print(f"  - Saved JSON: {json_path}")
         
         # Generate and save HTML
         if output_html:
             html_content = self.create_contractor_html(contractor_data)
             html_path = os.path.join(self.output_dir, f"{clean_name}.html")
-            with open(html_path, 'w') as f:
-                f.write(html_content)
+            Path(html_path).write_text(html_content, encoding='utf-8')
             print(f"  - Saved HTML: {html_path}")
         
+        # Return the index entry with the result while the clean name and fields are at hand
+        # (added after the profile is saved, so it is not part of the JSON file)
+        contractor_data['index_entry'] = {
+            'company_name': contractor_data['company_info']['company_name'],
+            'total_permits': contractor_data['performance_metrics']['permit_data']['total_permits'],
+            'phone': contractor_data['contact_info']['main_phone'],
+            'html_file': f"{clean_name}.html",
+            'json_file': f"{clean_name}_data.json"
+        }
+        
         return contractor_data
     
     def process_top_contractors(self, limit=5):
@@ -302,12 +334,8 @@ class ContractorResearcher:
         top_contractors = self.contractors_df.nlargest(limit, 'Total_Permits')
         
         print(f"Processing top {limit} contractors by permit volume...")
-        results = []
-        
-        for idx, contractor in top_contractors.iterrows():
-            result = self.process_contractor(contractor)
-            results.append(result)
-            time.sleep(0.5)  # Be respectful with any future API calls
+        # Plain dicts support the same row['X'] / row.get('X') access as a Series without building one per row
+        results = [self.process_contractor(row) for row in top_contractors.to_dict(orient='records')]
         
         # Create an index file
         self.create_index_file(results)
@@ -316,17 +344,8 @@ class ContractorResearcher:
     
     def create_index_file(self, contractors_data: List[Dict]):
         """Create an index file listing all processed contractors"""
-        index_data = []
-        
-        for contractor in contractors_data:
-            clean_name = self.clean_company_name(contractor['company_info']['company_name'])
-            index_data.append({
-                'company_name': contractor['company_info']['company_name'],
-                'total_permits': contractor['performance_metrics']['permit_data']['total_permits'],
-                'phone': contractor['contact_info']['main_phone'],
-                'html_file': f"{clean_name}.html",
-                'json_file': f"{clean_name}_data.json"
-            })
+        # Each result carries the index entry built by process_contractor
+        index_data = [contractor['index_entry'] for contractor in contractors_data]
         
         # Save index
         index_path = os.path.join(self.output_dir, "contractor_index.json")
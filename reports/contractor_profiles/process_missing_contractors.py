@@ -9,7 +9,6 @@ import os
 from datetime import datetime
 import re
 from typing import Dict, List, Optional
-import time
 from contractor_research import ContractorResearcher
 
 
@@ -32,8 +31,14 @@ def main():
     
     print(f"Processing {len(missing_contractors)} missing contractors...")
     
-    # Load the CSV data
-    df = pd.read_csv(csv_path)
+    # Reuse the contractor data the researcher already loaded
+    df = researcher.contractors_df
+    
+    # Index stripped and lowercased names once, keeping the first row for each name
+    stripped_names = df['Company_Name'].str.strip().dropna().drop_duplicates()
+    exact_index = dict(zip(stripped_names, stripped_names.index))
+    lower_names = df['Company_Name'].str.lower().str.strip().dropna().drop_duplicates()
+    lower_index = dict(zip(lower_names, lower_names.index))
     
     # Find matching contractors
     found_contractors = []
@@ -41,18 +46,18 @@ def main():
     
     for contractor_name in missing_contractors:
         # Try exact match first
-        exact_match = df[df['Company_Name'].str.strip() == contractor_name.strip()]
+        exact_match = exact_index.get(contractor_name.strip())
         
-        if not exact_match.empty:
-            found_contractors.append(exact_match.iloc[0])
+        if exact_match is not None:
+            found_contractors.append(df.loc[exact_match])
             print(f"✓ Found: {contractor_name}")
             continue
         
         # Try case-insensitive match
-        case_match = df[df['Company_Name'].str.lower().str.strip() == contractor_name.lower().strip()]
+        case_match = lower_index.get(contractor_name.lower().strip())
         
-        if not case_match.empty:
-            found_contractors.append(case_match.iloc[0])
+        if case_match is not None:
+            found_contractors.append(df.loc[case_match])
             print(f"✓ Found: {contractor_name} (case insensitive)")
             continue
             
@@ -67,7 +72,6 @@ def main():
         for contractor_row in found_contractors:
             result = researcher.process_contractor(contractor_row)
             results.append(result)
-            time.sleep(0.5)
         
         # Update the index file
         existing_index_path = "contractor_profiles/contractor_index.json"
@@ -78,20 +82,14 @@ def main():
             existing_index = []
         
         # Add new contractors to index
+        indexed_names = {entry['company_name'] for entry in existing_index}
         for result in results:
-            clean_name = researcher.clean_company_name(result['company_info']['company_name'])
-            new_entry = {
-                'company_name': result['company_info']['company_name'],
-                'total_permits': result['performance_metrics']['permit_data']['total_permits'],
-                'phone': result['contact_info']['main_phone'],
-                'html_file': f"{clean_name}.html",
-                'json_file': f"{clean_name}_data.json"
-            }
+            new_entry = result['index_entry']
             
             # Check if already exists (avoid duplicates)
-            exists = any(entry['company_name'] == new_entry['company_name'] for entry in existing_index)
-            if not exists:
+            if new_entry['company_name'] not in indexed_names:
                 existing_index.append(new_entry)
+                indexed_names.add(new_entry['company_name'])
         
         # Sort by total permits descending
         existing_index.sort(key=lambda x: x['total_permits'], reverse=True)
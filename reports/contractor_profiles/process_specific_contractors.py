@@ -9,7 +9,6 @@ import os
 from datetime import datetime
 import re
 from typing import Dict, List, Optional
-import time
 from contractor_research import ContractorResearcher
 
 
@@ -48,8 +47,17 @@ def main():
     for i, name in enumerate(requested_contractors, 1):
         print(f"  {i:2d}. {name}")
     
-    # Load the CSV data
-    df = pd.read_csv(csv_path)
+    # Reuse the contractor data the researcher already loaded
+    df = researcher.contractors_df
+    
+    # Index stripped and lowercased names once, keeping the first row for each name
+    stripped_names = df['Company_Name'].str.strip().dropna().drop_duplicates()
+    exact_index = dict(zip(stripped_names, stripped_names.index))
+    lower_names = df['Company_Name'].str.lower().str.strip().dropna().drop_duplicates()
+    lower_index = dict(zip(lower_names, lower_names.index))
+    
+    # Uppercased names for partial matching (case-insensitive contains compares uppercase)
+    upper_names = list(df['Company_Name'].dropna().str.upper().items())
     
     # Find matching contractors
     found_contractors = []
@@ -57,17 +65,17 @@ def main():
     
     for requested_name in requested_contractors:
         # Try exact match first
-        exact_match = df[df['Company_Name'].str.strip() == requested_name.strip()]
+        exact_match = exact_index.get(requested_name.strip())
         
-        if not exact_match.empty:
-            found_contractors.append((requested_name, exact_match.iloc[0]))
+        if exact_match is not None:
+            found_contractors.append((requested_name, df.loc[exact_match]))
             continue
         
         # Try case-insensitive match
-        case_match = df[df['Company_Name'].str.lower().str.strip() == requested_name.lower().strip()]
+        case_match = lower_index.get(requested_name.lower().strip())
         
-        if not case_match.empty:
-            found_contractors.append((requested_name, case_match.iloc[0]))
+        if case_match is not None:
+            found_contractors.append((requested_name, df.loc[case_match]))
             continue
             
         # Try partial matching for common variations
@@ -83,10 +91,12 @@ def main():
         
         found_variation = False
         for variation in variations_to_try:
-            partial_match = df[df['Company_Name'].str.contains(variation, case=False, na=False, regex=False)]
-            if not partial_match.empty:
-                print(f"  Found '{requested_name}' as '{partial_match.iloc[0]['Company_Name']}'")
-                found_contractors.append((requested_name, partial_match.iloc[0]))
+            # Stop at the first name containing the variation instead of testing every row
+            variation_upper = variation.upper()
+            partial_match = next((idx for idx, name in upper_names if variation_upper in name), None)
+            if partial_match is not None:
+                print(f"  Found '{requested_name}' as '{df.loc[partial_match, 'Company_Name']}'")
+                found_contractors.append((requested_name, df.loc[partial_match]))
                 found_variation = True
                 break
         
@@ -107,8 +117,8 @@ def main():
             similar = df[df['Company_Name'].str.contains(name.split()[0], case=False, na=False)]
             if not similar.empty:
                 print(f"\n  Similar to '{name}':")
-                for _, row in similar.head(3).iterrows():
-                    print(f"    - {row['Company_Name']}")
+                for company_name in similar['Company_Name'].head(3):
+                    print(f"    - {company_name}")
     
     # Process found contractors
     if found_contractors:
@@ -119,7 +129,6 @@ def main():
             print(f"\nProcessing: {contractor_row['Company_Name']} (requested as: {requested_name})")
             result = researcher.process_contractor(contractor_row)
             results.append(result)
-            time.sleep(0.5)  # Be respectful with any future API calls
         
         # Update the index file with all contractors (existing + new)
         existing_index_path = "contractor_profiles/contractor_index.json"
@@ -130,20 +139,14 @@ def main():
             existing_index = []
         
         # Add new contractors to index
+        indexed_names = {entry['company_name'] for entry in existing_index}
         for result in results:
-            clean_name = researcher.clean_company_name(result['company_info']['company_name'])
-            new_entry = {
-                'company_name': result['company_info']['company_name'],
-                'total_permits': result['performance_metrics']['permit_data']['total_permits'],
-                'phone': result['contact_info']['main_phone'],
-                'html_file': f"{clean_name}.html",
-                'json_file': f"{clean_name}_data.json"
-            }
+            new_entry = result['index_entry']
             
             # Check if already exists (avoid duplicates)
-            exists = any(entry['company_name'] == new_entry['company_name'] for entry in existing_index)
-            if not exists:
+            if new_entry['company_name'] not in indexed_names:
                 existing_index.append(new_entry)
+                indexed_names.add(new_entry['company_name'])
         
         # Sort by total permits descending
         existing_index.sort(key=lambda x: x['total_permits'], reverse=True)
@@ -9,18 +9,21 @@ from pathlib import Path
 import re
 from datetime import datetime
 
+# Patterns used to build output file names from company names
+NON_WORD_RE = re.compile(r'[^\w\s-]')
+SEPARATOR_RE = re.compile(r'[-\s]+')
 
-def update_contractor_page(json_file_path, template_path, output_dir):
+# Template placeholders such as {COMPANY_NAME}
+PLACEHOLDER_RE = re.compile(r'\{[A-Z_]+\}')
+
+
+def update_contractor_page(json_file_path, template, output_dir):
     """Update a single contractor page with the simplified template"""
     
     # Load contractor data
     with open(json_file_path, 'r') as f:
         contractor_data = json.load(f)
     
-    # Load the simplified template
-    with open(template_path, 'r') as f:
-        template = f.read()
-    
     # Format values for display
     def format_currency(value):
         try:
@@ -65,15 +68,16 @@ def update_contractor_page(json_file_path, template_path, output_dir):
         '{SERVICE_AREAS}': format_list(location_info.get('service_areas', ['Minneapolis Area']))
     }
     
-    # Replace all placeholders
-    html_content = template
-    for placeholder, value in replacements.items():
-        html_content = html_content.replace(placeholder, str(value))
+    # Replace all placeholders in a single pass over the template
+    html_content = PLACEHOLDER_RE.sub(
+        lambda match: str(replacements.get(match.group(0), match.group(0))),
+        template
+    )
     
     # Generate output filename
     company_name = company_info.get('company_name', 'unknown')
-    clean_name = re.sub(r'[^\w\s-]', '', company_name)
-    clean_name = re.sub(r'[-\s]+', '_', clean_name).lower()
+    clean_name = NON_WORD_RE.sub('', company_name)
+    clean_name = SEPARATOR_RE.sub('_', clean_name).lower()
     output_file = os.path.join(output_dir, f"{clean_name}.html")
     
     # Write the updated HTML
@@ -90,18 +94,21 @@ def main():
     profiles_dir = Path("contractor_profiles")
     template_path = Path("contractor_detail_simple.html")
     
+    # Load the simplified template once for every page
+    template = template_path.read_text()
+    
     # Find all contractor JSON files
     json_files = list(profiles_dir.glob("*_data.json"))
     
     print(f"Found {len(json_files)} contractor data files to process")
     
-    # Process each contractor
+    # Process each contractor in file order (two company names can clean to the same page file)
     updated_count = 0
     for json_file in json_files:
         try:
             output_file, company_name = update_contractor_page(
                 json_file, 
-                template_path,
+                template,
                 profiles_dir
             )
             print(f"✓ Updated: {company_name}")
@@ -5,13 +5,48 @@ Update the contractor dashboard to add clickable links to contractor detail page
 
 import json
 import re
+import shutil
 from pathlib import Path
 
+# Patterns used to build detail page file names from company names
+NON_WORD_RE = re.compile(r'[^\w\s-]')
+SEPARATOR_RE = re.compile(r'[-\s]+')
+
+# Start of the contractor payload embedded in the dashboard script
+PAYLOAD_RE = re.compile(r'const contractor(?:Columns|Data) = (?=[\[{])')
+
+# Dashboard helpers inserted after the contractor data; braces are doubled for str.format
+HELPER_FUNCTIONS = '''
+        // Set of contractors with detail pages, for constant-time lookups per row
+        const contractorsWithDetails = new Set({companies_json});
+        
+        // Helper function to convert company name to filename
+        function getContractorFileName(companyName) {{
+            const cleanName = companyName
+                .replace(/[^\\w\\s-]/g, '')
+                .replace(/[-\\s]+/g, '_')
+                .toLowerCase();
+            return cleanName + '.html';
+        }}
+        
+        // Helper function to get company link or plain text
+        function getCompanyLink(companyName) {{
+            if (contractorsWithDetails.has(companyName)) {{
+                const fileName = getContractorFileName(companyName);
+                return `<a href="../contractor_profiles/contractor_profiles/${{fileName}}" 
+                        style="color: #1565c0; text-decoration: none; font-weight: 500;"
+                        onmouseover="this.style.textDecoration='underline'" 
+                        onmouseout="this.style.textDecoration='none'">${{escapeHtml(companyName)}}</a>`;
+            }}
+            return escapeHtml(companyName);
+        }}
+        '''
+
 
 def clean_company_name(name):
     """Clean company name for file naming (same as in contractor_research.py)"""
-    clean_name = re.sub(r'[^\w\s-]', '', name)
-    clean_name = re.sub(r'[-\s]+', '_', clean_name)
+    clean_name = NON_WORD_RE.sub('', name)
+    clean_name = SEPARATOR_RE.sub('_', clean_name)
     return clean_name.lower()
 
 
@@ -31,75 +66,34 @@ def update_dashboard():
     
     # Read the dashboard HTML
     dashboard_path = Path("../drill_down_reports/contractor_contact_dashboard_live.html")
-    with open(dashboard_path, 'r') as f:
-        html_content = f.read()
+    html_content = dashboard_path.read_text()
     
     # Create list of companies with detail pages
     companies_with_details = list(company_to_html.keys())
     companies_json = json.dumps(companies_with_details)
     
-    # Find the row.innerHTML assignment
-    row_innerHTML_pattern = r"(row\.innerHTML = `\s*<td>\$\{contractor\.company\}</td>)"
+    # Collect (start, end, replacement) edits against the original HTML and apply them in one pass
+    edits = []
     
-    if row_innerHTML_pattern not in html_content and not re.search(row_innerHTML_pattern, html_content):
-        # Try to find the exact pattern
-        match = re.search(r'row\.innerHTML = `([^`]+)`', html_content)
-        if match:
-            old_row_content = match.group(1)
-            # Replace the company cell
-            new_row_content = old_row_content.replace(
-                '<td>${contractor.company}</td>',
-                '<td>${getCompanyLink(contractor.company)}</td>'
-            )
-            html_content = html_content.replace(
-                f'row.innerHTML = `{old_row_content}`',
-                f'row.innerHTML = `{new_row_content}`'
-            )
+    # Link the company cell of the table row template
+    company_cell = '<td>${escapeHtml(contractor.company)}</td>'
+    cell_pos = html_content.find(company_cell)
+    while cell_pos != -1:
+        edits.append((cell_pos, cell_pos + len(company_cell), '<td>${getCompanyLink(contractor.company)}</td>'))
+        cell_pos = html_content.find(company_cell, cell_pos + len(company_cell))
     
     # Add the helper functions after contractorData
-    helper_functions = f'''
-        // List of contractors with detail pages
-        const contractorsWithDetails = {companies_json};
-        
-        // Helper function to convert company name to filename
-        function getContractorFileName(companyName) {{
-            const cleanName = companyName
-                .replace(/[^\\w\\s-]/g, '')
-                .replace(/[-\\s]+/g, '_')
-                .toLowerCase();
-            return cleanName + '.html';
-        }}
-        
-        // Helper function to get company link or plain text
-        function getCompanyLink(companyName) {{
-            if (contractorsWithDetails.includes(companyName)) {{
-                const fileName = getContractorFileName(companyName);
-                return `<a href="../contractor_profiles/contractor_profiles/${{fileName}}" 
-                        style="color: #1565c0; text-decoration: none; font-weight: 500;"
-                        onmouseover="this.style.textDecoration='underline'" 
-                        onmouseout="this.style.textDecoration='none'">${{companyName}}</a>`;
-            }}
-            return companyName;
-        }}
-        '''
+    helper_functions = HELPER_FUNCTIONS.format(companies_json=companies_json)
     
-    # Find where to insert the helper functions (after contractorData definition)
-    contractor_data_end = html_content.find('const contractorData = [')
-    if contractor_data_end != -1:
-        # Find the end of the contractorData array
-        bracket_count = 0
-        start_pos = html_content.find('[', contractor_data_end)
-        for i in range(start_pos, len(html_content)):
-            if html_content[i] == '[':
-                bracket_count += 1
-            elif html_content[i] == ']':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    insert_pos = html_content.find(';', i) + 1
-                    break
+    # Find where to insert the helper functions (after the embedded contractor data)
+    data_match = PAYLOAD_RE.search(html_content)
+    if data_match:
+        # Parse past the JSON payload so brackets inside names cannot end it early
+        _, data_end = json.JSONDecoder().raw_decode(html_content, data_match.end())
+        insert_pos = html_content.find(';', data_end) + 1
         
         # Insert the helper functions
-        html_content = html_content[:insert_pos] + '\n' + helper_functions + html_content[insert_pos:]
+        edits.append((insert_pos, insert_pos, '\n' + helper_functions))
     
     # No need to replace row rendering since we're modifying cell creation directly
     
@@ -123,20 +117,28 @@ def update_dashboard():
         # Insert before closing </style> tag
         style_close_pos = html_content.rfind('</style>')
         if style_close_pos != -1:
-            html_content = html_content[:style_close_pos] + css_addition + html_content[style_close_pos:]
+            edits.append((style_close_pos, style_close_pos, css_addition))
+    
+    # Stitch the unchanged spans and the edits together
+    parts = []
+    last_pos = 0
+    for start, end, replacement in sorted(edits, key=lambda edit: edit[0]):
+        parts.append(html_content[last_pos:start])
+        parts.append(replacement)
+        last_pos = end
+    parts.append(html_content[last_pos:])
+    html_content = ''.join(parts)
     
     # Save the updated dashboard
     output_path = Path("../drill_down_reports/contractor_contact_dashboard_live_updated.html")
-    with open(output_path, 'w') as f:
-        f.write(html_content)
+    output_path.write_text(html_content)
     
     print(f"✅ Dashboard updated successfully!")
     print(f"📁 Saved to: {output_path}")
     print(f"🔗 Added links for {len(company_to_html)} contractors")
     
-    # Also update the original file
-    with open(dashboard_path, 'w') as f:
-        f.write(html_content)
+    # Also update the original file by copying the one just written
+    shutil.copyfile(output_path, dashboard_path)
     print(f"✅ Original dashboard also updated: {dashboard_path}")
 
 
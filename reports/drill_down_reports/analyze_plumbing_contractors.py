@@ -5,9 +5,17 @@ Filter and analyze plumbing contractor data, appending 'warp' to the CSV output
 
 import pandas as pd
 
+# Columns of the applicant data written to the leads file
+SELECTED_COLUMNS = [
+    'applicant_name', 'total_permits', 'completion_rate', 'abandonment_rate',
+    'primary_use_case'
+]
+
 def main():
-    # Load existing plumbing contractors data
-    df = pd.read_csv('data/plumbing_all_applicants.csv')
+    # Load only the columns needed to filter and export plumbing contractors
+    df = pd.read_csv('data/plumbing_all_applicants.csv',
+                     usecols=SELECTED_COLUMNS + ['applicant_type'],
+                     dtype={'applicant_type': 'category'})
     
     # Filter only contractors
     contractor_df = df[df['applicant_type'] == 'Contractor']
@@ -16,11 +24,7 @@ def main():
     sorted_df = contractor_df.sort_values(by='total_permits', ascending=False)
 
     # Select relevant columns
-    selected_columns = [
-        'applicant_name', 'total_permits', 'completion_rate', 'abandonment_rate',
-        'primary_use_case'
-    ]
-    output_df = sorted_df[selected_columns]
+    output_df = sorted_df[SELECTED_COLUMNS]
 
     # Export the results to CSV
     output_filename = 'plumbing_leads_warp.csv'
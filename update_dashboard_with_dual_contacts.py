@@ -4,7 +4,13 @@ Update the contractor dashboard to show both permit contact person and license c
 """
 
 import pandas as pd
+import json
+import re
 import os
+from remove_license_contact_column import activity_codes
+
+# Start of the contractor payload embedded in the dashboard script
+PAYLOAD_RE = re.compile(r'const contractor(Columns|Data) = (?=[\[{])')
 
 def update_contact_data():
     """Add license contact person column to the existing data"""
@@ -51,17 +57,14 @@ def update_contact_data():
     df.to_csv(output_file, index=False)
     print(f"Saved updated data to: {output_file}")
     
-    # Also update the call list
-    call_ready = df[df['Phone_Number'].notna()].copy()
-    call_ready_file = 'reports/drill_down_reports/data/plumbing_contractors_call_list.csv'
-    
-    # Rename columns for the dashboard format
-    call_ready.rename(columns={
+    # Also update the call list, renaming columns for the dashboard format on the filtered rows
+    call_ready = df[df['Phone_Number'].notna()].rename(columns={
         'Company_Name': 'applicant_name',
         'Total_Permits': 'total_permits',
         'Last_Permit_Date': 'last_permit_date',
         'Activity_Level': 'activity_level'
-    }, inplace=True)
+    })
+    call_ready_file = 'reports/drill_down_reports/data/plumbing_contractors_call_list.csv'
     
     # Save the call list
     os.makedirs('reports/drill_down_reports/data', exist_ok=True)
@@ -78,45 +81,54 @@ def update_contact_data():
 def generate_updated_dashboard(df):
     """Generate the HTML dashboard with dual contact columns"""
     
-    # Prepare data for the dashboard
-    dashboard_data = []
-    
-    for _, row in df.iterrows():
-        dashboard_data.append({
-            'company': row['Company_Name'],
-            'permitContact': row['Permit_Contact_Person'] if pd.notna(row['Permit_Contact_Person']) else 'Not Available',
-            'licenseContact': row['License_Contact_Person'],
-            'phone': row['Phone_Number'] if pd.notna(row['Phone_Number']) else '',
-            'email': row['Email'] if pd.notna(row['Email']) else '',
-            'permits': int(row['Total_Permits']),
-            'lastPermit': str(row['Last_Permit_Date'])[:10] if pd.notna(row['Last_Permit_Date']) else '',
-            'activityLevel': row['Activity_Level'] if pd.notna(row['Activity_Level']) else '',
-            'source': row['Contact_Info_Source'] if pd.notna(row['Contact_Info_Source']) else 'Generated',
-            'confidence': row['Contact_Confidence'] if pd.notna(row['Contact_Confidence']) else 'Low'
-        })
+    activity_level = df['Activity_Level'].fillna('')
+    
+    # Prepare data for the dashboard column-wise, in the dashboard's columnar layout
+    dashboard_columns = pd.DataFrame({
+        'company': df['Company_Name'],
+        'permitContact': df['Permit_Contact_Person'].fillna('Not Available'),
+        'licenseContact': df['License_Contact_Person'],
+        'phone': df['Phone_Number'].fillna(''),
+        'email': df['Email'].fillna(''),
+        'permits': df['Total_Permits'].astype(int),
+        'lastPermit': df['Last_Permit_Date'].astype(str).str.slice(0, 10).where(df['Last_Permit_Date'].notna(), ''),
+        'activityLevel': activity_level,
+        'activityCode': activity_codes(activity_level),
+        'source': df['Contact_Info_Source'].fillna('Generated'),
+        'confidence': df['Contact_Confidence'].fillna('Low')
+    }).to_dict(orient='list')
     
     # Calculate statistics
+    has_phone = df['Phone_Number'].notna()
+    has_email = df['Email'].notna()
     total_contractors = len(df)
-    with_phone = df['Phone_Number'].notna().sum()
-    with_email = df['Email'].notna().sum()
-    with_both = (df['Phone_Number'].notna() & df['Email'].notna()).sum()
-    
-    # Generate the JavaScript data
-    js_data = 'const contractorData = ' + str(dashboard_data).replace("'", '"')
+    with_phone = has_phone.sum()
+    with_email = has_email.sum()
+    with_both = (has_phone & has_email).sum()
     
     # Read the template (we'll use the existing dashboard as a template)
     with open('reports/drill_down_reports/contractor_contact_dashboard_live.html', 'r') as f:
         html_content = f.read()
     
-    # Find the data section and update it
-    start_marker = 'const contractorData = ['
-    end_marker = '];'
-    
-    start_idx = html_content.find(start_marker)
-    end_idx = html_content.find(end_marker, start_idx) + len(end_marker)
+    # Find the data section (columnar pages embed contractorColumns, older ones contractorData)
+    data_match = PAYLOAD_RE.search(html_content)
+    if not data_match:
+        raise ValueError(
+            "contractor_contact_dashboard_live.html has no 'const contractorColumns = ' or "
+            "'const contractorData = ' payload; rebuild it with remove_license_contact_column.py first"
+        )
+    _, data_end = json.JSONDecoder().raw_decode(html_content, data_match.end())
+    end_idx = html_content.find(';', data_end) + 1
+    
+    # Generate the JavaScript data as compact JSON, in the layout the page already uses
+    if data_match.group(1) == 'Columns':
+        payload = dashboard_columns
+    else:
+        payload = [dict(zip(dashboard_columns, values)) for values in zip(*dashboard_columns.values())]
+    js_data = data_match.group(0) + json.dumps(payload, separators=(',', ':'))
     
     # Replace the data
-    new_html = html_content[:start_idx] + js_data + ';' + html_content[end_idx:]
+    new_html = html_content[:data_match.start()] + js_data + ';' + html_content[end_idx:]
     
     # Update the table headers to include both contact columns
     old_headers = '''<tr>
@@ -6,38 +6,39 @@ Prepare active plumbers data for batch upload to Google Sheets
 import pandas as pd
 import json
 
+# Columns written for each plumber in the batch file
+BATCH_COLUMNS = [
+    'Company_Name', 'Contact_Person', 'Address', 'City', 'Total_Permits', 'Activity_Level',
+    'Days_Since_Last_Permit', 'Avg_Permits_Per_Year', 'Service_Areas', 'Top_Work_Types',
+    'Total_Fees_Paid', 'First_Permit_Date', 'Last_Permit_Date'
+]
+
 def prepare_batch_data():
     """Prepare active plumbers data in batches for Google Sheets"""
     
     # Read the active plumbers CSV
-    df = pd.read_csv('plumber_contacts_active_only_Claude.csv')
-    
-    # Select top 20 active plumbers (most active based on permit volume)
-    top_plumbers = df.head(20)
+    df = pd.read_csv('plumber_contacts_active_only_Claude.csv', usecols=BATCH_COLUMNS)
     
-    # Create formatted output for each row
-    rows_output = []
-    for idx, row in top_plumbers.iterrows():
-        row_text = f"""Row {idx + 2}:
-Company: {row['Company_Name']}
-Contact: {row['Contact_Person']}
-Address: {row['Address']}
-City: {row['City']}
-Total Permits: {row['Total_Permits']}
-Activity Level: {row['Activity_Level']}
-Days Since Last: {row['Days_Since_Last_Permit']}
-Avg Per Year: {row['Avg_Permits_Per_Year']}
-Service Areas: {row['Service_Areas'][:100]}...
-Top Work Types: {row['Top_Work_Types']}
-Total Fees: ${row['Total_Fees_Paid']:,.2f}
-First Permit: {row['First_Permit_Date']}
-Last Permit: {row['Last_Permit_Date']}
-"""
-        rows_output.append(row_text)
+    # Select top 20 active plumbers (most active based on permit volume), whatever the file order
+    top_plumbers = df.nlargest(20, 'Total_Permits')
     
-    # Save to file for reference
+    # Save a readable text block per row for reference
     with open('active_plumbers_batch.txt', 'w') as f:
-        f.write('\n'.join(rows_output))
+        f.write('\n'.join(f"""Row {row.Index + 2}:
+Company: {row.Company_Name}
+Contact: {row.Contact_Person}
+Address: {row.Address}
+City: {row.City}
+Total Permits: {row.Total_Permits}
+Activity Level: {row.Activity_Level}
+Days Since Last: {row.Days_Since_Last_Permit}
+Avg Per Year: {row.Avg_Permits_Per_Year}
+Service Areas: {row.Service_Areas[:100]}...
+Top Work Types: {row.Top_Work_Types}
+Total Fees: ${row.Total_Fees_Paid:,.2f}
+First Permit: {row.First_Permit_Date}
+Last Permit: {row.Last_Permit_Date}
+""" for row in top_plumbers.itertuples()))
     
     print(f"Prepared {len(top_plumbers)} active plumber records")
     print("\nTop 5 most active plumbers by permit volume:")
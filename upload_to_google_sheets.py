@@ -12,20 +12,16 @@ def prepare_csv_for_sheets():
     print("Reading plumber contacts CSV...")
     df = pd.read_csv('plumber_contacts_Claude.csv')
     
-    # Convert all data to strings to avoid any type issues
-    for col in df.columns:
-        df[col] = df[col].astype(str).replace('nan', '')
-    
-    # Save as a temporary CSV with proper formatting
+    # Save as a temporary CSV with proper formatting (the writer leaves missing values empty)
     temp_filename = 'plumber_contacts_for_sheets.csv'
-    df.to_csv(temp_filename, index=False)
+    df.to_csv(temp_filename, index=False, na_rep='')
     
     print(f"Prepared {len(df)} rows for upload")
     print(f"Saved to temporary file: {temp_filename}")
     
     # Show sample of data
     print("\nFirst 5 rows:")
-    print(df.head())
+    print(df.head().fillna(''))
     
     return temp_filename, len(df)
 